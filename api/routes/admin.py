@@ -4,7 +4,7 @@ import uuid
 from fastapi import APIRouter, HTTPException, Query, status, UploadFile, File
 from sqlalchemy import func
 
-from ingest.schema import get_session, User, Account, Transaction
+from ingest.schema import get_session, dispose_engine, User, Account, Transaction
 from api.auth import get_password_hash
 from api.utils import get_db_path
 
@@ -189,6 +189,9 @@ async def upload_database(file: UploadFile = File(...)):
         db_file = Path(db_path)
         db_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # Drop pooled connections to the old file before it is overwritten
+        dispose_engine(db_path)
+        
         # Stream file in chunks to avoid memory issues
         CHUNK_SIZE = 1024 * 1024  # 1MB chunks
         with open(db_path, 'wb') as f:
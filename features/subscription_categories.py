@@ -1,5 +1,6 @@
 """Subscription category mapping for merchant categorization."""
 
+from functools import lru_cache
 from typing import Optional, Dict, List, Set
 
 
@@ -87,8 +88,20 @@ class SubscriptionCategoryMapper:
         if not merchant_name:
             return None
         
-        merchant_lower = merchant_name.lower().strip()
+        # Normalize before the cached lookup so "Netflix" and "NETFLIX " share an entry
+        return cls._categorize_normalized(merchant_name.lower().strip())
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _categorize_normalized(cls, merchant_lower: str) -> Optional[str]:
+        """Categorize an already lower-cased, stripped merchant name (memoized).
         
+        Args:
+            merchant_lower: Normalized merchant name
+            
+        Returns:
+            Category name or None
+        """
         # First, check exact matches in known merchant lists
         if merchant_lower in cls.STREAMING_SERVICES:
             return 'streaming'
@@ -3,12 +3,74 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 from collections import defaultdict
+import numpy as np
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
+from ingest.jit import njit
 from ingest.schema import Transaction, Account
 from features.subscription_categories import SubscriptionCategoryMapper
 
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+MICROSECONDS_PER_DAY = 86400 * 1000000
+
+# Rows fetched per round-trip when streaming transactions
+TRANSACTION_BATCH_SIZE = 5000
+
+# Cadence codes returned by _classify_merchants
+CADENCE_NONE = 0
+CADENCE_MONTHLY = 1
+CADENCE_WEEKLY = 2
+
+
+@njit(cache=True)
+def _classify_merchants(timestamps, amounts, offsets):
+    """Classify each merchant's transaction cadence.
+    
+    Transactions are laid out CSR-style: merchant i owns the slice
+    ``offsets[i]:offsets[i + 1]`` of ``timestamps`` and ``amounts``. Only
+    the timestamps within a slice need to be sorted.
+    
+    Args:
+        timestamps: Transaction times in epoch microseconds (int64)
+        amounts: Transaction amounts (float64)
+        offsets: Slice boundaries per merchant (int64, length n_merchants + 1)
+    
+    Returns:
+        Tuple of (cadence codes, average interval days, total absolute amounts)
+    """
+    n_merchants = offsets.shape[0] - 1
+    cadences = np.zeros(n_merchants, dtype=np.int8)
+    avg_intervals = np.zeros(n_merchants, dtype=np.float64)
+    totals = np.zeros(n_merchants, dtype=np.float64)
+    
+    for m in range(n_merchants):
+        start = offsets[m]
+        end = offsets[m + 1]
+        
+        # Whole days between consecutive transactions (matches timedelta.days)
+        interval_sum = 0
+        for i in range(start + 1, end):
+            interval_sum += (timestamps[i] - timestamps[i - 1]) // MICROSECONDS_PER_DAY
+        num_intervals = end - start - 1
+        avg_interval = interval_sum / num_intervals if num_intervals > 0 else 0.0
+        
+        total = 0.0
+        for i in range(start, end):
+            total += abs(amounts[i])
+        
+        avg_intervals[m] = avg_interval
+        totals[m] = total
+        
+        # Monthly pattern (25-35 days) or weekly (6-8 days)
+        if 25 <= avg_interval <= 35:
+            cadences[m] = CADENCE_MONTHLY
+        elif 6 <= avg_interval <= 8:
+            cadences[m] = CADENCE_WEEKLY
+    
+    return cadences, avg_intervals, totals
+
 
 class SubscriptionDetector:
     """Detect subscription patterns from transactions."""
@@ -41,71 +103,116 @@ class SubscriptionDetector:
         Returns:
             List of recurring merchant patterns
         """
-        # Get all transactions for user in date range, excluding loan accounts
-        transactions = self.db.query(Transaction).join(Account).filter(
+        # Get all transactions for user in date range, excluding loan accounts.
+        # Only the columns used below are selected, as plain row tuples, and
+        # rows are streamed in batches rather than materialized all at once.
+        transactions = self.db.query(
+            Transaction.date,
+            Transaction.amount,
+            Transaction.merchant_name,
+            Transaction.primary_category
+        ).join(Account).filter(
             and_(
                 Account.user_id == user_id,
                 Transaction.date >= start_date,
                 Transaction.date <= end_date,
                 Account.type != 'loan'  # Exclude mortgage and student loan accounts
             )
-        ).all()
+        ).yield_per(TRANSACTION_BATCH_SIZE)
         
         # Loan-related keywords to exclude from subscriptions
         loan_keywords = ['mortgage', 'student loan', 'studentloan', 'loan payment', 'loan servicer', 
                         'sallie mae', 'navient', 'mohela', 'federal student aid', 'fafsa',
                         'home loan', 'mortgage payment', 'principal', 'interest payment']
         
-        # Group by merchant name, excluding loan-related merchants
-        merchant_transactions = defaultdict(list)
-        for tx in transactions:
-            if tx.merchant_name and tx.amount < 0:  # Only expenses
-                merchant_lower = tx.merchant_name.lower()
+        # Group dates and amounts by merchant name, excluding loan-related merchants
+        merchant_dates = defaultdict(list)
+        merchant_amounts = defaultdict(list)
+        for tx_date, amount, merchant_name, primary_category in transactions:
+            if merchant_name and amount < 0:  # Only expenses
+                merchant_lower = merchant_name.lower()
                 # Skip if merchant name contains loan-related keywords
                 if any(keyword in merchant_lower for keyword in loan_keywords):
                     continue
                 # Skip if transaction category suggests it's a loan payment
-                if tx.primary_category and 'loan' in tx.primary_category.lower():
+                if primary_category and 'loan' in primary_category.lower():
                     continue
-                merchant_transactions[tx.merchant_name].append(tx)
+                merchant_dates[merchant_name].append(tx_date)
+                merchant_amounts[merchant_name].append(amount)
+        
+        # Flatten candidate merchants into CSR arrays (dates sorted per merchant)
+        candidates = []
+        timestamps = []
+        amounts = []
+        offsets = [0]
+        for merchant_name, dates in merchant_dates.items():
+            if len(dates) < min_occurrences:
+                continue
+            
+            dates_sorted = sorted(dates)
+            candidates.append((merchant_name, dates_sorted))
+            timestamps.extend((tx_date - EPOCH) // MICROSECOND for tx_date in dates_sorted)
+            amounts.extend(merchant_amounts[merchant_name])
+            offsets.append(len(timestamps))
+        
+        if not candidates:
+            return []
+        
+        cadences, avg_intervals, totals = _classify_merchants(
+            np.asarray(timestamps, dtype=np.int64),
+            np.asarray(amounts, dtype=np.float64),
+            np.asarray(offsets, dtype=np.int64)
+        )
         
         recurring_merchants = []
         
-        for merchant_name, txs in merchant_transactions.items():
-            if len(txs) < min_occurrences:
+        for i, (merchant_name, dates_sorted) in enumerate(candidates):
+            if cadences[i] == CADENCE_NONE:
                 continue
             
-            # Sort by date
-            txs_sorted = sorted(txs, key=lambda x: x.date)
+            occurrences = len(dates_sorted)
+            total_amount = float(totals[i])
             
-            # Check if transactions occur at regular intervals (monthly or weekly)
-            intervals = []
-            for i in range(1, len(txs_sorted)):
-                days_between = (txs_sorted[i].date - txs_sorted[i-1].date).days
-                intervals.append(days_between)
-            
-            # Check for monthly pattern (25-35 days) or weekly (6-8 days)
-            avg_interval = sum(intervals) / len(intervals) if intervals else 0
-            is_monthly = 25 <= avg_interval <= 35
-            is_weekly = 6 <= avg_interval <= 8
-            
-            if is_monthly or is_weekly:
-                total_amount = sum(abs(tx.amount) for tx in txs)
-                avg_amount = total_amount / len(txs)
-                
-                recurring_merchants.append({
-                    "merchant_name": merchant_name,
-                    "occurrences": len(txs),
-                    "cadence": "monthly" if is_monthly else "weekly",
-                    "average_interval_days": avg_interval,
-                    "total_amount": total_amount,
-                    "average_amount": avg_amount,
-                    "first_transaction": txs_sorted[0].date,
-                    "last_transaction": txs_sorted[-1].date
-                })
+            recurring_merchants.append({
+                "merchant_name": merchant_name,
+                "occurrences": occurrences,
+                "cadence": "monthly" if cadences[i] == CADENCE_MONTHLY else "weekly",
+                "average_interval_days": float(avg_intervals[i]),
+                "total_amount": total_amount,
+                "average_amount": total_amount / occurrences,
+                "first_transaction": dates_sorted[0],
+                "last_transaction": dates_sorted[-1]
+            })
         
         return recurring_merchants
     
+    def _calculate_total_spend(
+        self,
+        user_id: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> float:
+        """Sum all expenses in a period.
+        
+        Args:
+            user_id: User ID
+            start_date: Analysis start date
+            end_date: Analysis end date
+        
+        Returns:
+            Total absolute expense amount
+        """
+        all_amounts = self.db.query(Transaction.amount).join(Account).filter(
+            and_(
+                Account.user_id == user_id,
+                Transaction.date >= start_date,
+                Transaction.date <= end_date,
+                Transaction.amount < 0  # Only expenses
+            )
+        ).all()
+        
+        return sum(abs(amount) for amount, in all_amounts)
+    
     def calculate_subscription_metrics(
         self,
         user_id: str,
@@ -124,19 +231,10 @@ class SubscriptionDetector:
         Returns:
             Dictionary with subscription metrics
         """
+        # Both queries run on self.db so they see the same (possibly uncommitted) data
         recurring = self.detect_recurring_merchants(user_id, start_date, end_date)
+        total_spend = self._calculate_total_spend(user_id, start_date, end_date)
         
-        # Get all transactions in period
-        all_transactions = self.db.query(Transaction).join(Account).filter(
-            and_(
-                Account.user_id == user_id,
-                Transaction.date >= start_date,
-                Transaction.date <= end_date,
-                Transaction.amount < 0  # Only expenses
-            )
-        ).all()
-        
-        total_spend = sum(abs(tx.amount) for tx in all_transactions)
         subscription_spend = sum(merchant["total_amount"] for merchant in recurring)
         subscription_share = (subscription_spend / total_spend * 100) if total_spend > 0 else 0
         
@@ -151,21 +249,20 @@ class SubscriptionDetector:
         num_subscriptions = len(recurring)
         avg_subscription_cost = monthly_recurring / num_subscriptions if num_subscriptions > 0 else 0.0
         
-        # Category breakdown and duplicate detection
-        merchant_names = [merchant["merchant_name"] for merchant in recurring]
-        category_duplicates = SubscriptionCategoryMapper.get_category_duplicates(merchant_names)
-        
-        # Build category breakdown
-        subscription_categories: Dict[str, List[str]] = {}
+        # Build category breakdown (each merchant is categorized once)
+        subscription_categories: Dict[str, List[str]] = defaultdict(list)
         for merchant in recurring:
             category = SubscriptionCategoryMapper.categorize_subscription(merchant["merchant_name"])
             if category:
-                if category not in subscription_categories:
-                    subscription_categories[category] = []
                 subscription_categories[category].append(merchant["merchant_name"])
         
-        # Check if any category has 2+ subscriptions (duplicate category criterion)
-        has_category_duplicates = any(len(merchants) >= 2 for merchants in category_duplicates.values())
+        # Categories with 2+ subscriptions are potential duplicates
+        category_duplicates = {
+            category: merchants
+            for category, merchants in subscription_categories.items()
+            if len(merchants) >= 2
+        }
+        has_category_duplicates = bool(category_duplicates)
         
         # Calculate subscription-to-income ratio
         subscription_to_income_ratio = 0.0
@@ -180,7 +277,7 @@ class SubscriptionDetector:
             "total_subscription_spend": subscription_spend,
             "subscription_share_of_total": subscription_share,
             "subscription_to_income_ratio": subscription_to_income_ratio,
-            "subscription_categories": subscription_categories,
+            "subscription_categories": dict(subscription_categories),
             "category_duplicates": category_duplicates,
             "has_category_duplicates": has_category_duplicates,
             "total_spend": total_spend
@@ -3,6 +3,7 @@
 from typing import Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from ingest.schema import Consent, User
 import uuid
@@ -39,14 +40,17 @@ class ConsentManager:
         Returns:
             True if user has consented, False otherwise
         """
-        consent = self.get_consent(user_id)
-        return consent is not None and consent.consented is True
+        # Only the flag is needed here, so skip loading the full Consent row
+        consented = self.db.query(Consent.consented).filter(Consent.user_id == user_id).scalar()
+        return consented is True
     
-    def grant_consent(self, user_id: str) -> Consent:
-        """Grant consent for a user.
+    def _upsert_consent(self, user_id: str, insert_values: dict, update_values: dict) -> Consent:
+        """Insert or update a user's consent row in a single statement.
         
         Args:
             user_id: User ID
+            insert_values: Column values used when no consent row exists yet
+            update_values: Column values applied when a consent row already exists
         
         Returns:
             Created or updated Consent record
@@ -54,32 +58,54 @@ class ConsentManager:
         Raises:
             ValueError: If user doesn't exist
         """
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
+        user_exists = self.db.query(User.id).filter(User.id == user_id).first()
+        if not user_exists:
             raise ValueError(f"User not found: {user_id}")
         
-        consent = self.get_consent(user_id)
-        
-        if consent:
-            # Update existing consent
-            consent.consented = True
-            consent.consented_at = datetime.now()
-            consent.revoked_at = None
-            consent.updated_at = datetime.now()
-        else:
-            # Create new consent
-            consent = Consent(
-                id=str(uuid.uuid4()),
-                user_id=user_id,
-                consented=True,
-                consented_at=datetime.now(),
-                revoked_at=None
-            )
-            self.db.add(consent)
+        stmt = sqlite_insert(Consent).values(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            **insert_values
+        ).on_conflict_do_update(
+            index_elements=[Consent.user_id],
+            set_=update_values
+        ).returning(Consent)
+        
+        consent = self.db.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
         
         self.db.commit()
         return consent
     
+    def grant_consent(self, user_id: str) -> Consent:
+        """Grant consent for a user.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Created or updated Consent record
+        
+        Raises:
+            ValueError: If user doesn't exist
+        """
+        now = datetime.now()
+        return self._upsert_consent(
+            user_id,
+            insert_values={
+                "consented": True,
+                "consented_at": now,
+                "revoked_at": None
+            },
+            update_values={
+                "consented": True,
+                "consented_at": now,
+                "revoked_at": None,
+                "updated_at": now
+            }
+        )
+    
     def revoke_consent(self, user_id: str) -> Consent:
         """Revoke consent for a user.
         
@@ -92,29 +118,21 @@ class ConsentManager:
         Raises:
             ValueError: If user doesn't exist
         """
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise ValueError(f"User not found: {user_id}")
-        
-        consent = self.get_consent(user_id)
-        
-        if consent:
-            consent.consented = False
-            consent.revoked_at = datetime.now()
-            consent.updated_at = datetime.now()
-        else:
+        now = datetime.now()
+        return self._upsert_consent(
+            user_id,
             # Create consent record with revoked status
-            consent = Consent(
-                id=str(uuid.uuid4()),
-                user_id=user_id,
-                consented=False,
-                consented_at=None,
-                revoked_at=datetime.now()
-            )
-            self.db.add(consent)
-        
-        self.db.commit()
-        return consent
+            insert_values={
+                "consented": False,
+                "consented_at": None,
+                "revoked_at": now
+            },
+            update_values={
+                "consented": False,
+                "revoked_at": now,
+                "updated_at": now
+            }
+        )
     
     def require_consent(self, user_id: str) -> bool:
         """Check if user has consented, raise exception if not.
@@ -50,10 +50,12 @@ class EligibilityChecker:
         if user_features is None:
             user_features = self.feature_pipeline.compute_features_for_user(user_id, 180)
         
-        # Get user accounts
-        user_accounts = self.db.query(Account).filter(Account.user_id == user_id).all()
-        account_types = [acc.type for acc in user_accounts]
-        account_subtypes = [acc.subtype for acc in user_accounts if acc.subtype]
+        # Get user account types (only the columns we need, not full Account rows)
+        account_rows = self.db.query(Account.type, Account.subtype).filter(
+            Account.user_id == user_id
+        ).all()
+        account_types = [acc_type for acc_type, _ in account_rows]
+        account_subtypes = [acc_subtype for _, acc_subtype in account_rows if acc_subtype]
         
         # Check harmful products
         if criteria.is_harmful:
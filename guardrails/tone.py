@@ -46,15 +46,23 @@ class ToneValidator:
         self.judgmental_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.JUDGMENTAL_PATTERNS]
         self.empowering_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.EMPOWERING_PATTERNS]
     
-    def validate(self, text: str) -> Tuple[bool, List[str]]:
+    def validate(self, text: str, detail: bool = True) -> Tuple[bool, List[str]]:
         """Validate tone of text.
         
         Args:
             text: Text to validate
+            detail: If False, stop at the first shaming/judgmental match and
+                return an empty issues list (for callers that only need the bool)
         
         Returns:
             Tuple of (is_valid, issues) where issues is a list of detected problems
         """
+        if not detail:
+            for pattern in self.shaming_regex + self.judgmental_regex:
+                if pattern.search(text):
+                    return (False, [])
+            return (True, [])
+        
         issues = []
         text_lower = text.lower()
         
@@ -109,30 +117,38 @@ class ToneValidator:
         
         return sanitized
     
-    def check_rationale(self, rationale: str) -> Tuple[bool, List[str]]:
+    def check_rationale(self, rationale: str, detail: bool = True) -> Tuple[bool, List[str]]:
         """Check if a rationale meets tone requirements.
         
         Args:
             rationale: Rationale text to check
+            detail: If False, only the validity flag is computed (see validate)
         
         Returns:
             Tuple of (is_valid, issues)
         """
-        return self.validate(rationale)
+        return self.validate(rationale, detail=detail)
     
-    def check_recommendation(self, title: str, description: str, rationale: str) -> Tuple[bool, List[str]]:
+    def check_recommendation(
+        self,
+        title: str,
+        description: str,
+        rationale: str,
+        detail: bool = True
+    ) -> Tuple[bool, List[str]]:
         """Check if a recommendation meets tone requirements.
         
         Args:
             title: Recommendation title
             description: Recommendation description
             rationale: Recommendation rationale
+            detail: If False, only the validity flag is computed (see validate)
         
         Returns:
             Tuple of (is_valid, issues)
         """
         all_text = f"{title} {description} {rationale}"
-        return self.validate(all_text)
+        return self.validate(all_text, detail=detail)
 
 
 
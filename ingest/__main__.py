@@ -6,9 +6,6 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ingest.generator import SyntheticDataGenerator
-from ingest.loader import DataLoader
-
 
 def main():
     """Generate and load synthetic data."""
@@ -24,10 +21,14 @@ def main():
     parser.add_argument("--csv-path", type=str, default="data/transactions_final.csv", help="Path to transactions_final.csv")
     parser.add_argument("--use-synthetic-data-lib", action="store_true", help="Use synthetic-data library integration (removes lat/lng and fraud)")
     parser.add_argument("--clear-db", action="store_true", help="Clear existing database data before loading")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for user generation (default 1)")
     
     args = parser.parse_args()
     
     if not args.load_only:
+        # Imported here so --load-only runs skip the generator's dependencies
+        from ingest.generator import SyntheticDataGenerator
+        
         # Generate data
         if args.use_csv:
             print("Generating synthetic data from transactions_final.csv...")
@@ -39,15 +40,18 @@ def main():
             num_users=args.num_users,
             use_csv_source=args.use_csv,
             csv_path=args.csv_path,
-            use_synthetic_data_lib=args.use_synthetic_data_lib
+            use_synthetic_data_lib=args.use_synthetic_data_lib,
+            workers=args.workers
         )
         generator.generate_all()
         generator.save_to_csv(args.data_dir)
     
     if not args.generate_only:
+        from ingest.loader import DataLoader
+        
         # Load data
         print("\nLoading data into database...")
-        loader = DataLoader(db_path=args.db_path)
+        loader = DataLoader(db_path=args.db_path, fast_ingest=True)
         loader.load_from_csv(args.data_dir, clear_existing=args.clear_db)
         loader.close()
         print("Done!")
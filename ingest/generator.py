@@ -1,12 +1,20 @@
 """Synthetic data generator for Plaid-style financial data."""
 
+import itertools
+import os
 import random
-import uuid
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from faker import Faker
+import numpy as np
 import pandas as pd
 
+from ingest.jit import njit
+
 # Try to import synthetic-data integration
 try:
     from ingest.synthetic_data_integration import SyntheticDataIntegration
@@ -14,9 +22,373 @@ try:
 except ImportError:
     SYNTHETIC_DATA_INTEGRATION_AVAILABLE = False
 
-fake = Faker()
 random.seed(42)
-Faker.seed(42)
+
+# Common consumer email domains (sampled instead of calling Faker's domain_name() per user)
+EMAIL_DOMAINS = [
+    "gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "icloud.com",
+    "aol.com", "protonmail.com", "comcast.net", "msn.com", "live.com"
+]
+
+
+def _weighted_table(names) -> Tuple[List[str], Optional[List[float]]]:
+    """Split a Faker name table into (names, cumulative weights) for random.choices."""
+    if isinstance(names, dict):
+        return list(names), list(itertools.accumulate(names.values()))
+    return list(names), None
+
+
+@lru_cache(maxsize=1)
+def _name_tables() -> Tuple[Tuple[List[str], Optional[List[float]]], ...]:
+    """Load the first- and last-name tables behind Faker's person provider once.
+    
+    Users sample from these tables with the same weights Faker uses,
+    keeping Faker's provider dispatch out of per-user generation. Faker is
+    only instantiated here; no IDs, dates or amounts are drawn from it.
+    """
+    person = next(
+        provider for provider in Faker().providers
+        if hasattr(provider, "first_names") and hasattr(provider, "last_names")
+    )
+    return _weighted_table(person.first_names), _weighted_table(person.last_names)
+
+
+MICROSECOND = timedelta(microseconds=1)
+
+# Whole-day timedeltas indexed by day count, shared by the schedule loops
+DAY_DELTAS = tuple(timedelta(days=days) for days in range(91))
+
+
+@njit(cache=True)
+def _running_balance_kernel(account_codes, amounts, starting_balances):
+    """Running balance per account over transactions in date order.
+    
+    Adds each amount to its account's balance in sequence, so the floating
+    point result matches a plain per-row accumulation exactly.
+    
+    Args:
+        account_codes: Index into `starting_balances` for each transaction
+        amounts: Signed transaction amounts
+        starting_balances: Balance of each account before its first transaction
+    
+    Returns:
+        Balance of the transaction's account after each transaction
+    """
+    balances = starting_balances.copy()
+    out = np.empty_like(amounts)
+    for i in range(amounts.shape[0]):
+        code = account_codes[i]
+        balances[code] += amounts[i]
+        out[i] = balances[code]
+    return out
+
+
+def _month_starts(start_date: datetime, end_date: datetime) -> pd.DatetimeIndex:
+    """First day of every month from start_date's month through end_date's month.
+    
+    Keeps start_date's time of day, like stepping start_date.replace(day=1)
+    forward one month at a time while it is <= end_date.
+    """
+    first = start_date.replace(day=1)
+    num_months = (end_date.year - first.year) * 12 + end_date.month - first.month + 1
+    months = pd.date_range(first, periods=max(num_months, 0), freq="MS")
+    return months[months <= end_date]
+
+
+def _account_id12(rng: random.Random) -> str:
+    """Generate a 12-digit account ID with a non-zero first digit."""
+    return str(rng.randint(10**11, 10**12 - 1))
+
+
+@lru_cache(maxsize=None)
+def _export_category(primary_category: str) -> str:
+    """transactions_final.csv merchant_category for a primary category."""
+    return primary_category.lower().replace(" & ", "_").replace(" ", "_")
+
+
+def _write_csv(df: pd.DataFrame, path: str, chunksize: int = 50000):
+    """Write a DataFrame to CSV in chunks via a temporary file.
+    
+    The file is renamed into place once fully written, so readers never
+    see a partially written CSV.
+    """
+    tmp_path = f"{path}.tmp"
+    df.to_csv(tmp_path, index=False, chunksize=chunksize)
+    os.replace(tmp_path, path)
+
+
+# Column layout shared by every generated transaction record
+TRANSACTION_COLUMNS = (
+    "id", "account_id", "transaction_id", "date", "amount", "merchant_name",
+    "merchant_entity_id", "payment_channel", "primary_category",
+    "detailed_category", "pending"
+)
+
+# Low-cardinality string columns that are dictionary-encoded in the DataFrame
+CATEGORICAL_TRANSACTION_COLUMNS = (
+    "merchant_name", "payment_channel", "primary_category", "detailed_category"
+)
+
+
+class _TransactionColumns:
+    """Column-oriented (struct-of-arrays) store for generated transactions.
+    
+    Keeps one list per column instead of one dict per transaction, so the
+    generated data set holds no per-record dicts and becomes a DataFrame
+    without any row-to-column conversion.
+    """
+    
+    __slots__ = ("columns",)
+    
+    def __init__(self):
+        self.columns = {name: [] for name in TRANSACTION_COLUMNS}
+    
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+    
+    def add(
+        self,
+        record_id: str,
+        account_id: str,
+        transaction_id: str,
+        date: datetime,
+        amount: float,
+        merchant_name: str,
+        payment_channel: str,
+        primary_category: str,
+        detailed_category: str,
+        pending: bool = False
+    ):
+        """Add one transaction from its column values, without building a record dict."""
+        columns = self.columns
+        columns["id"].append(record_id)
+        columns["account_id"].append(account_id)
+        columns["transaction_id"].append(transaction_id)
+        columns["date"].append(date)
+        columns["amount"].append(amount)
+        columns["merchant_name"].append(merchant_name)
+        columns["merchant_entity_id"].append(None)
+        columns["payment_channel"].append(payment_channel)
+        columns["primary_category"].append(primary_category)
+        columns["detailed_category"].append(detailed_category)
+        columns["pending"].append(pending)
+    
+    def add_batch(
+        self,
+        record_ids: List[str],
+        account_id: str,
+        transaction_ids: List[str],
+        dates: List[datetime],
+        amounts: List[float],
+        merchant_name: Any,
+        payment_channel: Any,
+        primary_category: Any,
+        detailed_category: Any,
+        pending: Any = False
+    ):
+        """Add a batch of transactions column by column.
+        
+        The id, date and amount arguments hold one value per transaction; the
+        remaining arguments are either such a list or a single value shared by
+        every transaction in the batch.
+        """
+        n = len(record_ids)
+        columns = self.columns
+        columns["id"].extend(record_ids)
+        columns["account_id"].extend(itertools.repeat(account_id, n))
+        columns["transaction_id"].extend(transaction_ids)
+        columns["date"].extend(dates)
+        columns["amount"].extend(amounts)
+        columns["merchant_entity_id"].extend(itertools.repeat(None, n))
+        for name, value in (
+            ("merchant_name", merchant_name),
+            ("payment_channel", payment_channel),
+            ("primary_category", primary_category),
+            ("detailed_category", detailed_category),
+            ("pending", pending),
+        ):
+            columns[name].extend(value if isinstance(value, list) else itertools.repeat(value, n))
+    
+    def extend_columns(self, columns: Dict[str, List[Any]]):
+        """Add another store's column lists (e.g. from a worker process)."""
+        for name, values in self.columns.items():
+            values.extend(columns[name])
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Build a DataFrame directly from the column lists.
+        
+        Each column is converted to its final dtype up front so pandas does
+        not have to infer types; low-cardinality string columns are stored
+        as pandas Categoricals (integer codes plus one copy of each value).
+        """
+        columns = dict(self.columns)
+        columns["date"] = pd.DatetimeIndex(columns["date"])
+        columns["amount"] = np.array(columns["amount"], dtype=np.float64)
+        columns["pending"] = np.array(columns["pending"], dtype=bool)
+        for name in CATEGORICAL_TRANSACTION_COLUMNS:
+            columns[name] = pd.Categorical(columns[name])
+        return pd.DataFrame(columns, copy=False)
+
+
+class _UUIDPool:
+    """Hand out random UUID4 strings from bulk os.urandom reads.
+    
+    Entropy for a whole batch is read at once, the version/variant bits are
+    set on the batch with NumPy, and the batch is hex-encoded in a single
+    ``bytes.hex()`` call, so the per-record cost is just a string slice
+    instead of a ``uuid.UUID`` construction.
+    """
+    
+    __slots__ = ("batch_size", "_ids", "_offset")
+    
+    def __init__(self, batch_size: int = 4096):
+        self.batch_size = batch_size
+        self._ids: List[str] = []
+        self._offset = 0
+    
+    def _refill(self, n: int):
+        """Format ``n`` fresh UUID4 strings into the pool."""
+        raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+        hex_ids = raw.tobytes().hex()
+        self._ids = [
+            f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+            for h in (hex_ids[i:i + 32] for i in range(0, 32 * n, 32))
+        ]
+        self._offset = 0
+    
+    def next(self) -> str:
+        """Return a new UUID4 string (same format as ``str(uuid.uuid4())``)."""
+        if self._offset >= len(self._ids):
+            self._refill(self.batch_size)
+        uid = self._ids[self._offset]
+        self._offset += 1
+        return uid
+    
+    def take(self, n: int) -> List[str]:
+        """Return ``n`` new UUID4 strings at once.
+        
+        Args:
+            n: Number of IDs to return
+        
+        Returns:
+            List of UUID4 strings
+        """
+        available = len(self._ids) - self._offset
+        if available < n:
+            leftover = self._ids[self._offset:]
+            self._refill(max(self.batch_size, n - available))
+            ids = leftover + self._ids[:n - available]
+            self._offset = n - available
+            return ids
+        ids = self._ids[self._offset:self._offset + n]
+        self._offset += n
+        return ids
+
+
+@dataclass(frozen=True)
+class PersonaConfig:
+    """Numeric account/transaction tunables for one persona.
+    
+    Ranges are (low, high) bounds for uniform draws, or inclusive bounds for counts.
+    """
+    # Written out by hand: dataclass(slots=True) needs Python 3.10 (runtime.txt pins 3.9)
+    __slots__ = (
+        "checking_balance", "card_probability", "card_count", "credit_utilization",
+        "savings_probability", "savings_balance", "num_subscriptions"
+    )
+    
+    checking_balance: Tuple[float, float]
+    card_probability: float  # Chance of having any credit cards
+    card_count: Tuple[int, int]
+    credit_utilization: Optional[Tuple[float, float]]  # None: use the financial profile's range
+    savings_probability: float
+    savings_balance: Tuple[float, float]
+    num_subscriptions: Tuple[int, int]
+
+
+# Strict per-persona settings so that generated users match their assigned persona
+PERSONA_CONFIG = {
+    "high_utilization": PersonaConfig(
+        checking_balance=(1000, 5000),
+        # ALWAYS has cards with high balances: MUST be ≥50% utilization to match
+        card_probability=1.0,
+        card_count=(1, 2),
+        credit_utilization=(0.50, 0.95),
+        # NO savings account to avoid matching savings_builder
+        savings_probability=0.0,
+        savings_balance=(0, 0),
+        # Lower subscriptions to avoid matching subscription_heavy
+        num_subscriptions=(0, 2),
+    ),
+    "variable_income_budgeter": PersonaConfig(
+        # Low cash buffer (<1 month expenses) so cash_flow_buffer_months < 1.0
+        checking_balance=(200, 800),
+        # May have cards, but utilization <50% to avoid matching high_utilization
+        card_probability=0.6,
+        card_count=(0, 1),
+        credit_utilization=(0.15, 0.45),
+        # May have savings but lower amounts
+        savings_probability=0.5,
+        savings_balance=(100, 3000),
+        num_subscriptions=(1, 3),
+    ),
+    "subscription_heavy": PersonaConfig(
+        checking_balance=(1000, 5000),
+        # May have cards, but utilization <50% to avoid matching high_utilization
+        card_probability=0.6,
+        card_count=(0, 1),
+        credit_utilization=(0.15, 0.45),
+        savings_probability=0.7,
+        savings_balance=(100, 5000),
+        # MUST have ≥3 subscriptions AND (≥$50/month OR ≥10% of spend)
+        num_subscriptions=(4, 7),
+    ),
+    "savings_builder": PersonaConfig(
+        # Moderate checking, more in savings
+        checking_balance=(1000, 5000),
+        # May have cards but MUST be <30% utilization to match
+        card_probability=0.5,
+        card_count=(0, 1),
+        credit_utilization=(0.05, 0.25),
+        # Always has a savings account with a high balance
+        savings_probability=1.0,
+        savings_balance=(5000, 50000),
+        num_subscriptions=(1, 3),
+    ),
+    "balanced_stable": PersonaConfig(
+        # Higher checking balance so cash_flow_buffer >= 1 month
+        checking_balance=(2000, 8000),
+        # Moderate cards; MUST be <50% utilization to avoid matching high_utilization
+        card_probability=0.7,
+        card_count=(0, 2),
+        credit_utilization=(0.10, 0.40),
+        # Usually has savings
+        savings_probability=0.8,
+        savings_balance=(2000, 20000),
+        # <5 subscriptions to match persona criteria
+        num_subscriptions=(1, 3),
+    ),
+}
+
+# Users without a known persona: no credit cards, profile-based utilization
+DEFAULT_PERSONA_CONFIG = PersonaConfig(
+    checking_balance=(1000, 5000),
+    card_probability=0.0,
+    card_count=(0, 0),
+    credit_utilization=None,
+    savings_probability=0.7,
+    savings_balance=(100, 5000),
+    num_subscriptions=(2, 3),
+)
+
+# Credit utilization by financial profile (when the persona doesn't set one)
+PROFILE_UTILIZATION_RANGES = {
+    "high_utilization": (0.8, 0.95),
+    "saver": (0.05, 0.3),
+}
+DEFAULT_UTILIZATION_RANGE = (0.2, 0.6)
 
 
 class SyntheticDataGenerator:
@@ -114,33 +486,92 @@ class SyntheticDataGenerator:
         },
     }
     
-    def _get_realistic_amount(self, category: str) -> float:
-        """Get a realistic transaction amount for a category based on transactions_final.csv patterns.
+    # Same ranges as (min, q25, median, q75, max) tuples for the hot sampling paths
+    CATEGORY_AMOUNT_RANGES_T = {
+        category: (ranges["min"], ranges["q25"], ranges["median"], ranges["q75"], ranges["max"])
+        for category, ranges in CATEGORY_AMOUNT_RANGES.items()
+    }
+    
+    def _get_realistic_amounts(self, codes: np.ndarray) -> np.ndarray:
+        """Get realistic transaction amounts for a batch of categories.
+        
+        Uses a quartile-based distribution matching transactions_final.csv
+        patterns: 25% of amounts fall in each quartile and the fourth quartile
+        reaches the category maximum only 10% of the time (q75-1.5*q75
+        otherwise). The quartile bin, the occasional very large amount and the
+        uniform value are drawn for every category in a few NumPy calls.
         
-        Uses quartile-based distribution to match real-world patterns.
+        Args:
+            codes: Row of each category in _category_bounds (-1 if unknown)
         """
-        if category not in self.CATEGORY_AMOUNT_RANGES:
-            # Default range
-            return random.uniform(10.0, 150.0)
-        
-        ranges = self.CATEGORY_AMOUNT_RANGES[category]
-        # Use weighted selection based on quartiles (more realistic distribution)
-        rand = random.random()
-        if rand < 0.25:
-            # 25% in first quartile
-            return random.uniform(ranges["min"], ranges["q25"])
-        elif rand < 0.5:
-            # 25% in second quartile
-            return random.uniform(ranges["q25"], ranges["median"])
-        elif rand < 0.75:
-            # 25% in third quartile
-            return random.uniform(ranges["median"], ranges["q75"])
-        else:
-            # 25% in fourth quartile (with occasional large transactions)
-            if random.random() < 0.1:  # 10% chance of very large
-                return random.uniform(ranges["q75"], ranges["max"])
-            else:
-                return random.uniform(ranges["q75"], ranges["q75"] * 1.5)
+        n = len(codes)
+        known = codes >= 0
+        bounds = self._category_bounds[np.where(known, codes, 0)]
+        
+        # 25% per quartile; the fourth quartile only reaches max 10% of the time
+        quartile = self.rng.integers(0, 4, size=n)
+        rows = np.arange(n)
+        low = bounds[rows, quartile]
+        high = bounds[rows, quartile + 1]
+        in_q4 = quartile == 3
+        very_large = self.rng.random(n) < 0.1
+        high = np.where(in_q4 & ~very_large, bounds[:, 3] * 1.5, high)
+        
+        # Default range for unknown categories
+        low = np.where(known, low, 10.0)
+        high = np.where(known, high, 150.0)
+        return self.rng.uniform(low, high)
+    
+    def _choose_merchants(self, codes: np.ndarray) -> List[str]:
+        """Pick a uniformly random merchant from each category's list in one batch.
+        
+        Args:
+            codes: Index of each category in MERCHANT_CATEGORIES
+        """
+        picks = (self.rng.random(len(codes)) * self._merchant_counts[codes]).astype(np.int64)
+        return self._merchant_table[self._merchant_offsets[codes] + picks].tolist()
+    
+    def _sample_purchases(
+        self,
+        n: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Tuple[List[str], np.ndarray, List[str], List[datetime], List[str], List[bool]]:
+        """Draw a batch of purchases.
+        
+        Categories are drawn uniformly from MERCHANT_CATEGORIES as indices, so
+        the amount and merchant lookups work on codes without any per-purchase
+        dict access. Every field is drawn in batch from self.rng.
+        
+        Purchases from the last 48 hours are pending with 15% probability.
+        
+        Args:
+            n: Number of purchases
+            start_date: Start of the transaction window
+            end_date: End of the transaction window
+        
+        Returns:
+            Tuple of (categories, amounts, merchants, dates, payment channels,
+            pending flags)
+        """
+        span_us = (end_date - start_date) // MICROSECOND
+        # Pending transactions should only be in last 24-48 hours
+        pending_from_us = (self._now - timedelta(hours=48) - start_date) // MICROSECOND
+        category_codes = self.rng.integers(0, len(self._purchase_categories), size=n)
+        amounts = self._get_realistic_amounts(self._purchase_amount_codes[category_codes])
+        merchants = self._choose_merchants(category_codes)
+        offsets_us = self.rng.integers(0, span_us + 1, size=n)
+        channel_codes = self.rng.integers(0, len(self.PAYMENT_CHANNELS), size=n)
+        pending = (offsets_us >= pending_from_us) & (self.rng.random(n) < 0.15)
+        dates = np.datetime64(start_date, "us") + offsets_us.astype("timedelta64[us]")
+        return (
+            self._purchase_categories[category_codes].tolist(),
+            amounts,
+            merchants,
+            dates.tolist(),
+            self.PAYMENT_CHANNELS[channel_codes].tolist(),
+            pending.tolist()
+        )
     
     # Subscription merchants (recurring)
     SUBSCRIPTION_MERCHANTS = [
@@ -148,6 +579,91 @@ class SyntheticDataGenerator:
         "YouTube Premium", "Amazon Prime", "Microsoft 365", "Adobe Creative Cloud",
         "Gym Membership", "Fitness App", "Newsletter Subscription"
     ]
+    _NUM_SUB_MERCHANTS = len(SUBSCRIPTION_MERCHANTS)
+    _SUBSCRIPTION_MERCHANT_SET = frozenset(SUBSCRIPTION_MERCHANTS)
+    
+    # Athletic retailers (monthly purchases) and their amount ranges
+    ATHLETIC_RETAILERS = ["Nike", "Adidas", "Puma", "Reebok", "New Balance"]
+    ATHLETIC_AMOUNT_RANGES = {
+        "Nike": (50.0, 200.0),
+        "Adidas": (50.0, 200.0),
+        "Puma": (40.0, 150.0),
+        "Reebok": (40.0, 150.0),
+        "New Balance": (50.0, 180.0),
+    }
+    
+    # Channel lookups for batched channel draws (in-store/online only, or any of the three)
+    PAYMENT_CHANNELS_IN_STORE_ONLINE = np.array(["in store", "online"], dtype=object)
+    PAYMENT_CHANNELS = np.array(["in store", "online", "other"], dtype=object)
+    
+    # Paycheck amount range by (pay frequency, financial profile)
+    # Target median yearly income: $60-70K, minimum: ~$28K
+    # Bi-weekly (26 paychecks/year): $28K/26=$1,077, $60K/26=$2,308, $70K/26=$2,692 → median ~$2,500
+    # Monthly (12 paychecks/year): $28K/12=$2,333, $60K/12=$5,000, $70K/12=$5,833 → median ~$5,417
+    PAYCHECK_AMOUNT_RANGES = {
+        ("biweekly", "high_income"): (2800, 3800),  # $72,800-$98,800 yearly
+        ("biweekly", "middle_income"): (2200, 2800),  # $57,200-$72,800 yearly (median ~$65K)
+        ("biweekly", "variable_income"): (2000, 3000),  # Then scaled by 0.8-1.2
+        ("biweekly", "low_income"): (1150, 1900),  # $29,900-$49,400 yearly (min ~$28K)
+        ("monthly", "high_income"): (6000, 8000),  # $72,000-$96,000 yearly
+        ("monthly", "middle_income"): (5000, 5800),  # $60,000-$69,600 yearly (median ~$65K)
+        ("monthly", "variable_income"): (4500, 6000),  # Then scaled by 0.8-1.2
+        ("monthly", "low_income"): (2400, 3600),  # $28,800-$43,200 yearly (min ~$28K)
+    }
+    # Any other profile: mix of low to middle income
+    DEFAULT_PAYCHECK_AMOUNT_RANGES = {
+        "biweekly": (1150, 2700),  # $29,900-$70,200 yearly
+        "monthly": (2400, 5700),  # $28,800-$68,400 yearly
+    }
+    
+    # Variable-income persona paycheck range by (paychecks over 180 days, low income?)
+    # Fewer, larger paychecks keep yearly income around $60-70K ($28-35K for low income)
+    VARIABLE_PAYCHECK_AMOUNT_RANGES = {
+        (2, True): (14000, 18000),
+        (2, False): (28000, 35000),
+        (3, True): (9000, 14000),
+        (3, False): (18000, 24000),
+    }
+    
+    # Monthly loan payment merchant and amount range by loan subtype
+    LOAN_PAYMENTS = {
+        "mortgage": ("MORTGAGE PAYMENT", (800, 2000)),  # Typical mortgage payment: $800-$2000
+        "student_loan": ("STUDENT LOAN PAYMENT", (100, 600)),  # Typical student loan payment: $100-$600
+    }
+    
+    # Export payment_method for each payment_channel (non-credit accounts)
+    PAYMENT_CHANNEL_METHODS = {
+        "online": "digital_wallet",
+        "in store": "debit_card",
+        "other": "bank_transfer",
+    }
+    
+    # transactions_final.csv columns with only a handful of distinct values
+    EXPORT_CATEGORICAL_COLUMNS = (
+        "merchant_category", "transaction_type", "payment_method",
+        "amount_category", "status", "day_of_week", "month_name"
+    )
+    
+    # Credit card account names (built once instead of formatted per card)
+    CREDIT_CARD_NAMES = tuple(
+        f"{card_type} Credit Card" for card_type in ("Visa", "Mastercard", "American Express", "Discover")
+    )
+    
+    # Monthly amount range per subscription merchant (anything else: $5-20)
+    SUBSCRIPTION_AMOUNT_RANGES = {
+        "Netflix": (8, 15),
+        "Spotify": (8, 15),
+        "Disney+": (8, 15),
+        "HBO Max": (8, 15),
+        "Apple Music": (10, 15),
+        "YouTube Premium": (10, 15),
+        "Amazon Prime": (12, 15),
+        "Microsoft 365": (10, 25),
+        "Adobe Creative Cloud": (10, 25),
+        "Gym Membership": (20, 60),
+        "Fitness App": (20, 60),
+        "Newsletter Subscription": (5, 20),
+    }
     
     def __init__(
         self,
@@ -155,6 +671,8 @@ class SyntheticDataGenerator:
         use_csv_source: bool = False,
         csv_path: str = "data/transactions_final.csv",
         use_synthetic_data_lib: bool = False,
+        seed: Optional[int] = None,
+        workers: int = 1,
     ):
         """Initialize generator.
         
@@ -163,17 +681,53 @@ class SyntheticDataGenerator:
             use_csv_source: If True, use transactions_final.csv as source for transaction data
             csv_path: Path to transactions_final.csv file
             use_synthetic_data_lib: If True, use synthetic-data library integration (removes lat/lng and fraud)
+            seed: Seed for this generator's RNGs (default: drawn from the module's seeded random state)
+            workers: Number of worker processes used by generate_all (default 1, no pool)
         """
         self.num_users = num_users
         self.users = []
         self.accounts = []
-        self.transactions = []
+        self.transactions = _TransactionColumns()
         self.liabilities = []
         self._merchant_id_map = {}
+        # Income profiles handed out so far by _map_persona_to_profile
+        self._profile_counter = {"low": 0, "middle": 0, "high": 0}
+        self._id_pool = _UUIDPool()
+        # Transaction IDs: random per-generator prefix + counter (unique across generators/batches)
+        self._transaction_ids = map(f"txn_{os.urandom(6).hex()}{{:08x}}".format, itertools.count())
+        self._user_identities = []
+        # Emails handed out so far, and the last numeric suffix used per base email
+        self._emails = set()
+        self._email_suffixes = {}
+        self._rng = random.Random(seed if seed is not None else random.getrandbits(64))
+        self.rng = np.random.default_rng(self._rng.getrandbits(64))
+        
+        # One "now" for the whole run: the transaction window end, pending flags
+        # and account/liability timestamps are all relative to it
+        self._now = datetime.now()
+        self._now_us = np.datetime64(self._now, "us")
+        
+        # (min, q25, median, q75, max) lookup table for vectorized amount sampling
+        self._category_codes = {category: code for code, category in enumerate(self.CATEGORY_AMOUNT_RANGES_T)}
+        self._category_bounds = np.array(list(self.CATEGORY_AMOUNT_RANGES_T.values()))
+        
+        # Flat merchant table with per-category offsets/counts for batched merchant picks
+        self._merchant_table = np.array(
+            [merchant for merchants in self.MERCHANT_CATEGORIES.values() for merchant in merchants],
+            dtype=object
+        )
+        self._merchant_counts = np.array([len(merchants) for merchants in self.MERCHANT_CATEGORIES.values()])
+        self._merchant_offsets = np.concatenate(([0], np.cumsum(self._merchant_counts)[:-1]))
+        
+        # Purchase categories (indexed like the merchant table) and their amount-table rows
+        self._purchase_categories = np.array(list(self.MERCHANT_CATEGORIES), dtype=object)
+        self._purchase_amount_codes = np.array(
+            [self._category_codes.get(category, -1) for category in self.MERCHANT_CATEGORIES]
+        )
         self.use_csv_source = use_csv_source
         self.csv_path = csv_path
         self.use_synthetic_data_lib = use_synthetic_data_lib and SYNTHETIC_DATA_INTEGRATION_AVAILABLE
-        self._low_risk_two_account_count = 0  # Track low-risk users with exactly 2 accounts
+        self.workers = max(1, workers)
         
         # Initialize synthetic-data integration if requested
         if self.use_synthetic_data_lib:
@@ -182,56 +736,111 @@ class SyntheticDataGenerator:
         else:
             self.synthetic_integration = None
         
+    def _rand_past_dt(self, days: int, min_days: int = 0) -> datetime:
+        """Get a random datetime between `days` and `min_days` days before now.
+        
+        Uses plain timedelta arithmetic instead of Faker's date_time_between,
+        which parses its relative date strings on every call.
+        """
+        seconds = self._rng.randrange(min_days * 86400, days * 86400 + 1)
+        return self._now - timedelta(seconds=seconds)
+    
+    def _rand_future_dt(self, days: int) -> datetime:
+        """Get a random datetime between now and `days` days from now."""
+        seconds = self._rng.randrange(0, days * 86400 + 1)
+        return self._now + timedelta(seconds=seconds)
+    
+    def _generate_user_identities(self, count: int) -> List[tuple]:
+        """Generate (first_name, last_name, email_domain) tuples for a batch of users."""
+        (first_name_pool, first_name_weights), (last_name_pool, last_name_weights) = _name_tables()
+        first_names = self._rng.choices(first_name_pool, cum_weights=first_name_weights, k=count)
+        last_names = self._rng.choices(last_name_pool, cum_weights=last_name_weights, k=count)
+        domains = self._rng.choices(EMAIL_DOMAINS, k=count)
+        return list(zip(first_names, last_names, domains))
+    
+    def _claim_email(self, email: str) -> str:
+        """Reserve an email, numbering it (local2@domain) if it is already taken.
+        
+        The user ID tag makes repeats unlikely, but the database requires unique
+        emails, so a repeat within this run is still numbered.
+        
+        Args:
+            email: Candidate email
+        
+        Returns:
+            The email itself, or the first free numbered variant of it
+        """
+        if email in self._emails:
+            local, domain = email.split("@", 1)
+            suffix = self._email_suffixes.get(email, 1)
+            while True:
+                suffix += 1
+                candidate = f"{local}{suffix}@{domain}"
+                if candidate not in self._emails:
+                    break
+            self._email_suffixes[email] = suffix
+            email = candidate
+        self._emails.add(email)
+        return email
+    
     def generate_user(self) -> Dict[str, Any]:
         """Generate a single user with matching name and email."""
-        user_id = str(uuid.uuid4())
-        # Generate name
-        first_name = fake.first_name()
-        last_name = fake.last_name()
+        user_id = self._id_pool.next()
+        # Names for all users are generated up front in one batch
+        if not self._user_identities:
+            self._user_identities = self._generate_user_identities(max(self.num_users, 1))
+            self._user_identities.reverse()
+        first_name, last_name, domain = self._user_identities.pop()
         full_name = f"{first_name} {last_name}"
         
-        # Generate matching email based on name
-        email = f"{first_name.lower()}.{last_name.lower()}@{fake.domain_name()}"
+        # Generate matching email based on name, tagged with the start of the user ID
+        # so users added to an existing database by later runs don't collide
+        email = self._claim_email(f"{first_name.lower()}.{last_name.lower()}.{user_id[:8]}@{domain}")
         
         return {
             "id": user_id,
             "name": full_name,
             "email": email,
-            "created_at": fake.date_time_between(start_date="-2y", end_date="-1m")
+            "created_at": self._rand_past_dt(730, min_days=30)
         }
     
-    def generate_accounts(self, user_id: str, financial_profile: str, persona: str = None) -> List[Dict[str, Any]]:
+    def generate_accounts(
+        self,
+        user_id: str,
+        financial_profile: str,
+        persona: str = None,
+        low_risk_two_accounts: bool = False
+    ) -> List[Dict[str, Any]]:
         """Generate accounts for a user based on financial profile.
         
         Args:
             user_id: User ID
             financial_profile: One of 'high_income', 'middle_income', 'low_income',
                              'high_utilization', 'saver', 'variable_income'
+            persona: Assigned persona
+            low_risk_two_accounts: If True, a savings_builder/balanced_stable user gets
+                exactly 2 accounts (checking + savings, no credit cards)
         """
+        # Bind this generator's RNG methods once; they are called in every loop below
+        _uniform = self._rng.uniform
+        _randint = self._rng.randint
+        _choice = self._rng.choice
+        _rand = self._rng.random
+        
         accounts = []
         
         # Everyone gets at least a checking account
-        # Generate 12-digit account ID (ensure first digit is 1-9 to avoid leading zeros)
-        checking_account_id = str(random.randint(1, 9)) + ''.join([str(random.randint(0, 9)) for _ in range(11)])
+        # Generate 12-digit account ID
+        checking_account_id = _account_id12(self._rng)
+        
+        # Persona-specific tunables (strict enforcement to ensure persona matching)
+        config = PERSONA_CONFIG.get(persona, DEFAULT_PERSONA_CONFIG)
         
         # Persona-specific checking balance (for cash-flow buffer)
-        # Strict enforcement to ensure persona matching
-        if persona == "variable_income_budgeter":
-            # Variable income: low cash buffer (<1 month expenses = ~$200-1000)
-            # This ensures cash_flow_buffer_months < 1.0
-            checking_balance = random.uniform(200, 800)
-        elif persona == "savings_builder":
-            # Savings builder: moderate checking, more in savings
-            checking_balance = random.uniform(1000, 5000)
-        elif persona == "balanced_stable":
-            # Balanced: higher checking balance to ensure cash_flow_buffer >= 1 month
-            checking_balance = random.uniform(2000, 8000)
-        else:
-            # Others: normal checking balance
-            checking_balance = random.uniform(1000, 5000)
+        checking_balance = _uniform(*config.checking_balance)
         
         accounts.append({
-            "id": str(uuid.uuid4()),
+            "id": self._id_pool.next(),
             "user_id": user_id,
             "account_id": checking_account_id,
             "name": "Primary Checking",
@@ -245,81 +854,33 @@ class SyntheticDataGenerator:
         })
         
         # Determine credit cards FIRST (needed for savings account logic)
-        # Strict persona enforcement: ensure users only match their assigned persona
-        num_credit_cards = 0
-        if persona == "high_utilization":
-            # High utilization: ALWAYS has cards with high balances (50-95% utilization)
-            # This ensures they match high_utilization persona
-            num_credit_cards = random.randint(1, 2)
-        elif persona == "savings_builder":
-            # Savings builder: may have cards but LOW utilization (<30%)
-            # Special case: Allow 2 low-risk users (savings_builder) with exactly 2 accounts
-            if self._low_risk_two_account_count < 2:
-                # This will be one of the 2 low-risk users with 2 accounts (no credit cards)
-                num_credit_cards = 0
-            else:
-                # Savings builders can have cards but with low utilization
-                num_credit_cards = random.randint(0, 1) if random.random() < 0.5 else 0
-        elif persona == "balanced_stable":
-            # Balanced: moderate cards, moderate utilization (10-40%)
-            # Special case: 2 users should have only 2 accounts total (checking + savings, no credit cards)
-            if self._low_risk_two_account_count < 2:
-                # This will be one of the 2 low-risk users with 2 accounts (no credit cards)
-                num_credit_cards = 0
-            else:
-                # Other balanced users get 0-2 credit cards with moderate utilization
-                num_credit_cards = random.randint(0, 2) if random.random() < 0.7 else 0
-        elif persona == "variable_income_budgeter":
-            # Variable income: may have cards, but utilization should be moderate to avoid matching high_utilization
-            num_credit_cards = random.randint(0, 1) if random.random() < 0.6 else 0
-        elif persona == "subscription_heavy":
-            # Subscription-heavy: may have cards, but utilization should be moderate
-            num_credit_cards = random.randint(0, 1) if random.random() < 0.6 else 0
+        if low_risk_two_accounts:
+            # One of the 2 low-risk users with exactly 2 accounts (no credit cards)
+            num_credit_cards = 0
+        elif config.card_probability >= 1.0 or _rand() < config.card_probability:
+            num_credit_cards = _randint(*config.card_count)
         else:
-            # Default: no credit cards
             num_credit_cards = 0
         
         # Add savings account - persona-specific logic
-        has_savings = False
-        if persona == "high_utilization":
-            # High utilization: NO savings account to avoid matching savings_builder
-            has_savings = False
-            savings_balance = 0
-        elif persona == "savings_builder":
-            # Savings builder: always has savings account with high balance
-            # But if it's one of the 2 low-risk users with 2 accounts, track it
+        if low_risk_two_accounts:
+            # One of the 2 low-risk users with exactly 2 accounts (checking + savings)
             has_savings = True
-            if self._low_risk_two_account_count < 2 and num_credit_cards == 0:
-                savings_balance = random.uniform(5000, 50000)
-                self._low_risk_two_account_count += 1
-            else:
-                savings_balance = random.uniform(5000, 50000)
-        elif persona == "balanced_stable":
-            # Balanced: usually has savings
-            # Special case: 2 users should have exactly 2 accounts (checking + savings, no credit cards)
-            if self._low_risk_two_account_count < 2 and num_credit_cards == 0:
-                # This will be one of the 2 low-risk users with 2 accounts
-                has_savings = True
-                savings_balance = random.uniform(2000, 20000)
-                self._low_risk_two_account_count += 1
-            else:
-                has_savings = random.random() < 0.8
-                savings_balance = random.uniform(2000, 20000) if has_savings else 0
-        elif persona == "variable_income_budgeter":
-            # Variable income: may have savings but lower amounts
-            has_savings = random.random() < 0.5
-            savings_balance = random.uniform(100, 3000) if has_savings else 0
         else:
-            # Others: standard chance
-            has_savings = random.random() < 0.7
-            savings_balance = random.uniform(1000, 50000) if (has_savings and financial_profile == "saver") else (random.uniform(100, 5000) if has_savings else 0)
+            has_savings = config.savings_probability >= 1.0 or _rand() < config.savings_probability
+        if not has_savings:
+            savings_balance = 0
+        elif persona not in PERSONA_CONFIG and financial_profile == "saver":
+            savings_balance = _uniform(1000, 50000)
+        else:
+            savings_balance = _uniform(*config.savings_balance)
         
         if has_savings:
-            # Generate 12-digit account ID (ensure first digit is 1-9)
-            account_id_12digit = str(random.randint(1, 9)) + ''.join([str(random.randint(0, 9)) for _ in range(11)])
+            # Generate 12-digit account ID
+            account_id_12digit = _account_id12(self._rng)
             
             accounts.append({
-                "id": str(uuid.uuid4()),
+                "id": self._id_pool.next(),
                 "user_id": user_id,
                 "account_id": account_id_12digit,
                 "name": "Savings Account",
@@ -332,48 +893,38 @@ class SyntheticDataGenerator:
                 "holder_category": "individual"
             })
         
-        for _ in range(num_credit_cards):
-            limit = random.choice([5000, 10000, 15000, 20000, 25000])
-            
-            # Persona-specific balance logic (strict enforcement)
-            if persona == "high_utilization":
-                # High utilization: MUST be ≥50% to match persona criteria
-                balance = limit * random.uniform(0.50, 0.95)  # 50-95% utilization
-            elif persona == "savings_builder":
-                # Savings builder: MUST be <30% utilization to match persona criteria
-                balance = limit * random.uniform(0.05, 0.25)  # 5-25% utilization (low)
-            elif persona == "balanced_stable":
-                # Balanced: MUST be <50% utilization to avoid matching high_utilization
-                balance = limit * random.uniform(0.10, 0.40)  # 10-40% utilization (moderate)
-            elif persona == "variable_income_budgeter":
-                # Variable income: Moderate utilization, but <50% to avoid matching high_utilization
-                balance = limit * random.uniform(0.15, 0.45)  # 15-45% utilization
-            elif persona == "subscription_heavy":
-                # Subscription-heavy: Moderate utilization, but <50% to avoid matching high_utilization
-                balance = limit * random.uniform(0.15, 0.45)  # 15-45% utilization
-            elif financial_profile == "high_utilization":
-                balance = limit * random.uniform(0.8, 0.95)
-            elif financial_profile == "saver":
-                balance = limit * random.uniform(0.05, 0.3)
-            else:
-                balance = limit * random.uniform(0.2, 0.6)
+        # Persona-specific utilization range, falling back to the financial profile
+        utilization_range = config.credit_utilization or PROFILE_UTILIZATION_RANGES.get(
+            financial_profile, DEFAULT_UTILIZATION_RANGE
+        )
+        
+        # Draw limits, utilizations, APRs and overdue flags for all cards at once
+        card_limits = self.rng.choice([5000, 10000, 15000, 20000, 25000], size=num_credit_cards).tolist()
+        card_utilizations = self.rng.uniform(*utilization_range, size=num_credit_cards).tolist()
+        card_aprs = self.rng.uniform(15.0, 29.99, size=num_credit_cards).tolist()
+        # Only high_utilization can be overdue
+        card_overdue = (self.rng.random(num_credit_cards) < 0.4).tolist() if persona == "high_utilization" else [False] * num_credit_cards
+        
+        for card_index, (limit, utilization, apr_percentage, is_overdue) in enumerate(
+            zip(card_limits, card_utilizations, card_aprs, card_overdue)
+        ):
+            balance = limit * utilization
             
-            # Generate 12-digit account ID (ensure first digit is 1-9)
-            account_id_12digit = str(random.randint(1, 9)) + ''.join([str(random.randint(0, 9)) for _ in range(11)])
+            # Generate 12-digit account ID
+            account_id_12digit = _account_id12(self._rng)
             
             # Different card types for multiple cards
-            card_types = ['Visa', 'Mastercard', 'American Express', 'Discover']
-            card_name = f"{random.choice(card_types)} Credit Card"
+            card_name = _choice(self.CREDIT_CARD_NAMES)
             if num_credit_cards > 1:
-                card_name = f"{card_name} #{_ + 1}"
+                card_name = sys.intern(f"{card_name} #{card_index + 1}")
             
-            # Calculate amount due (current balance)
-            amount_due = balance
             # Minimum payment is typically 2% of balance or $25, whichever is higher
-            minimum_payment_due = max(balance * 0.02, 25.0)
+            minimum_payment_due = balance * 0.02
+            if minimum_payment_due < 25.0:
+                minimum_payment_due = 25.0
             
             accounts.append({
-                "id": str(uuid.uuid4()),
+                "id": self._id_pool.next(),
                 "user_id": user_id,
                 "account_id": account_id_12digit,
                 "name": card_name,
@@ -383,7 +934,7 @@ class SyntheticDataGenerator:
                 "available": limit - balance,
                 "current": balance,
                 "limit": limit,
-                "amount_due": amount_due,  # Total amount due
+                "amount_due": balance,  # Total amount due (current balance)
                 "minimum_payment_due": minimum_payment_due,  # Minimum payment due
                 "holder_category": "individual"
             })
@@ -394,45 +945,44 @@ class SyntheticDataGenerator:
                 is_minimum_only = True  # Always minimum-only for high_utilization
             else:
                 is_minimum_only = False  # Other personas don't use minimum-only payments
-            minimum_payment_amt = max(balance * 0.02, 25.0)
             
             # Set last_payment_amount based on behavior
             if is_minimum_only:
-                last_payment_amount = minimum_payment_amt  # Always minimum
+                last_payment_amount = minimum_payment_due  # Always minimum
             else:
                 # Variable: sometimes minimum, sometimes more
-                last_payment_amount = minimum_payment_amt if random.random() < 0.4 else random.uniform(minimum_payment_amt * 1.5, balance * 0.5)
+                last_payment_amount = minimum_payment_due if _rand() < 0.4 else _uniform(minimum_payment_due * 1.5, balance * 0.5)
             
             # Add liability for credit card
             self.liabilities.append({
-                "id": str(uuid.uuid4()),
+                "id": self._id_pool.next(),
                 "account_id": accounts[-1]["account_id"],
-                "apr_type": random.choice(["variable", "fixed"]),
-                "apr_percentage": random.uniform(15.0, 29.99),
-                "minimum_payment_amount": minimum_payment_amt,
+                "apr_type": _choice(("variable", "fixed")),
+                "apr_percentage": apr_percentage,
+                "minimum_payment_amount": minimum_payment_due,
                 "last_payment_amount": last_payment_amount,  # Based on behavior pattern
-                "last_payment_date": fake.date_time_between(start_date="-30d", end_date="now"),
-                "is_overdue": random.random() < 0.4 if persona == "high_utilization" else False,  # Only high_utilization can be overdue
-                "next_payment_due_date": fake.date_time_between(start_date="now", end_date="+15d"),
+                "last_payment_date": self._rand_past_dt(30),
+                "is_overdue": is_overdue,
+                "next_payment_due_date": self._rand_future_dt(15),
                 "last_statement_balance": balance,
                 "liability_type": "credit_card"
             })
         
         # Add HSA (20% of users)
-        if random.random() < 0.2:
-            # Generate 12-digit account ID (ensure first digit is 1-9)
-            account_id_12digit = str(random.randint(1, 9)) + ''.join([str(random.randint(0, 9)) for _ in range(11)])
+        if _rand() < 0.2:
+            # Generate 12-digit account ID
+            account_id_12digit = _account_id12(self._rng)
             
             accounts.append({
-                "id": str(uuid.uuid4()),
+                "id": self._id_pool.next(),
                 "user_id": user_id,
                 "account_id": account_id_12digit,
                 "name": "Health Savings Account",
                 "type": "depository",
                 "subtype": "hsa",
                 "iso_currency_code": "USD",
-                "available": random.uniform(500, 5000),
-                "current": random.uniform(500, 5000),
+                "available": _uniform(500, 5000),
+                "current": _uniform(500, 5000),
                 "limit": None,
                 "holder_category": "individual"
             })
@@ -440,18 +990,18 @@ class SyntheticDataGenerator:
         # Add mortgage (35% of users)
         # Note: Users can have both mortgage and student loans - each is a separate account
         # with its own interest_rate and next_payment_due_date
-        if random.random() < 0.35:
+        if _rand() < 0.35:
             # Mortgage balance (outstanding principal)
-            mortgage_balance = random.uniform(150000, 500000)
-            original_balance = mortgage_balance * random.uniform(1.2, 1.5)  # Original was higher
-            interest_rate = random.uniform(3.0, 7.5)  # Typical mortgage rates
-            next_payment_due_date = fake.date_time_between(start_date="now", end_date="+30d")
+            mortgage_balance = _uniform(150000, 500000)
+            original_balance = mortgage_balance * _uniform(1.2, 1.5)  # Original was higher
+            interest_rate = _uniform(3.0, 7.5)  # Typical mortgage rates
+            next_payment_due_date = self._rand_future_dt(30)
             
-            # Generate 12-digit account ID (ensure first digit is 1-9)
-            account_id_12digit = str(random.randint(1, 9)) + ''.join([str(random.randint(0, 9)) for _ in range(11)])
+            # Generate 12-digit account ID
+            account_id_12digit = _account_id12(self._rng)
             
             accounts.append({
-                "id": str(uuid.uuid4()),
+                "id": self._id_pool.next(),
                 "user_id": user_id,
                 "account_id": account_id_12digit,
                 "name": "Mortgage",
@@ -469,14 +1019,14 @@ class SyntheticDataGenerator:
             
             # Add liability for mortgage
             self.liabilities.append({
-                "id": str(uuid.uuid4()),
+                "id": self._id_pool.next(),
                 "account_id": accounts[-1]["account_id"],
                 "apr_type": None,  # Not applicable for mortgages
                 "apr_percentage": None,
                 "minimum_payment_amount": None,
                 "last_payment_amount": None,
                 "last_payment_date": None,
-                "is_overdue": random.random() < 0.05,  # 5% chance of overdue
+                "is_overdue": _rand() < 0.05,  # 5% chance of overdue
                 "next_payment_due_date": next_payment_due_date,
                 "last_statement_balance": None,
                 "interest_rate": interest_rate,
@@ -484,20 +1034,20 @@ class SyntheticDataGenerator:
             })
         
         # Add student loan (25-35% of users)
-        if random.random() < 0.30:
+        if _rand() < 0.30:
             # Student loan balance
-            loan_balance = random.uniform(10000, 80000)
-            interest_rate = random.uniform(3.5, 8.5)  # Typical student loan rates
-            next_payment_due_date = fake.date_time_between(start_date="now", end_date="+30d")
+            loan_balance = _uniform(10000, 80000)
+            interest_rate = _uniform(3.5, 8.5)  # Typical student loan rates
+            next_payment_due_date = self._rand_future_dt(30)
             
-            # Generate 12-digit account ID (ensure first digit is 1-9)
-            account_id_12digit = str(random.randint(1, 9)) + ''.join([str(random.randint(0, 9)) for _ in range(11)])
+            # Generate 12-digit account ID
+            account_id_12digit = _account_id12(self._rng)
             
             accounts.append({
-                "id": str(uuid.uuid4()),
+                "id": self._id_pool.next(),
                 "user_id": user_id,
                 "account_id": account_id_12digit,
-                "name": random.choice(["Federal Student Loan", "Private Student Loan", "Student Loan"]),
+                "name": _choice(("Federal Student Loan", "Private Student Loan", "Student Loan")),
                 "type": "loan",
                 "subtype": "student_loan",
                 "iso_currency_code": "USD",
@@ -512,14 +1062,14 @@ class SyntheticDataGenerator:
             
             # Add liability for student loan
             self.liabilities.append({
-                "id": str(uuid.uuid4()),
+                "id": self._id_pool.next(),
                 "account_id": accounts[-1]["account_id"],
                 "apr_type": None,  # Not applicable for student loans
                 "apr_percentage": None,
                 "minimum_payment_amount": None,
                 "last_payment_amount": None,
                 "last_payment_date": None,
-                "is_overdue": random.random() < 0.08,  # 8% chance of overdue (slightly higher than mortgage)
+                "is_overdue": _rand() < 0.08,  # 8% chance of overdue (slightly higher than mortgage)
                 "next_payment_due_date": next_payment_due_date,
                 "last_statement_balance": None,
                 "interest_rate": interest_rate,
@@ -534,10 +1084,37 @@ class SyntheticDataGenerator:
         start_date: datetime, 
         end_date: datetime,
         financial_profile: str,
-        persona: str = None
-    ) -> List[Dict[str, Any]]:
-        """Generate transactions for an account."""
-        transactions = []
+        persona: str = None,
+        liability: Optional[Dict[str, Any]] = None
+    ) -> _TransactionColumns:
+        """Generate transactions for an account.
+        
+        Only reads the account, its liability and this generator's RNGs, so
+        accounts can be generated independently of each other.
+        
+        Args:
+            account: Account record
+            start_date: Start of the transaction window
+            end_date: End of the transaction window
+            financial_profile: Financial profile of the account's user
+            persona: Assigned persona
+            liability: Liability record of a credit account (looked up in
+                self.liabilities if not given)
+        
+        Returns:
+            The account's transactions as a column store
+        """
+        # Bind this generator's RNG methods once; they are called in every loop below
+        _uniform = self._rng.uniform
+        _randint = self._rng.randint
+        _choice = self._rng.choice
+        _rand = self._rng.random
+        _sample = self._rng.sample
+        _transaction_ids = self._transaction_ids
+        
+        transactions = _TransactionColumns()
+        # Unpack the account fields used throughout once
+        account_id = account["account_id"]
         account_type = account["type"]
         account_subtype = account.get("subtype", "")
         
@@ -545,180 +1122,120 @@ class SyntheticDataGenerator:
             # Generate subscription transactions first (recurring, periodic)
             if account_subtype == "checking":
                 # Persona-specific subscription count (strict enforcement)
-                if persona == "subscription_heavy":
-                    # Subscription-heavy: MUST have ≥3 subscriptions AND (≥$50/month OR ≥10% of spend)
-                    # Generate 4-7 subscriptions to ensure they meet criteria
-                    num_subscriptions = random.randint(4, 7)
-                elif persona == "balanced_stable":
-                    # Balanced: <5 subscriptions to match persona criteria
-                    num_subscriptions = random.randint(1, 3)
-                elif persona == "high_utilization":
-                    # High utilization: Lower subscriptions to avoid matching subscription_heavy
-                    num_subscriptions = random.randint(0, 2)
-                elif persona == "variable_income_budgeter":
-                    # Variable income: Lower subscriptions
-                    num_subscriptions = random.randint(1, 3)
-                elif persona == "savings_builder":
-                    # Savings builder: Lower subscriptions
-                    num_subscriptions = random.randint(1, 3)
-                else:
-                    # Default: 2-3 subscriptions
-                    num_subscriptions = random.randint(2, 3)
+                num_subscriptions = _randint(*PERSONA_CONFIG.get(persona, DEFAULT_PERSONA_CONFIG).num_subscriptions)
                 
-                subscription_merchants = random.sample(self.SUBSCRIPTION_MERCHANTS, min(num_subscriptions, len(self.SUBSCRIPTION_MERCHANTS)))
+                if num_subscriptions > self._NUM_SUB_MERCHANTS:
+                    num_subscriptions = self._NUM_SUB_MERCHANTS
+                subscription_merchants = _sample(self.SUBSCRIPTION_MERCHANTS, num_subscriptions)
                 
-                for merchant in subscription_merchants:
-                    # Determine subscription frequency: monthly (30 days), bi-monthly (60 days), or 30-day interval
-                    frequency = random.choice(["monthly", "bimonthly", "30day"])
-                    if frequency == "monthly":
-                        interval_days = 30
-                    elif frequency == "bimonthly":
-                        interval_days = 60
-                    else:  # 30day
-                        interval_days = 30
-                    
-                    # Subscription amount based on merchant type
-                    if "Netflix" in merchant or "Spotify" in merchant or "Disney+" in merchant or "HBO Max" in merchant:
-                        sub_amount = random.uniform(8, 15)
-                    elif "Apple Music" in merchant or "YouTube Premium" in merchant:
-                        sub_amount = random.uniform(10, 15)
-                    elif "Amazon Prime" in merchant:
-                        sub_amount = random.uniform(12, 15)
-                    elif "Microsoft 365" in merchant or "Adobe" in merchant:
-                        sub_amount = random.uniform(10, 25)
-                    elif "Gym" in merchant or "Fitness" in merchant:
-                        sub_amount = random.uniform(20, 60)
-                    else:
-                        sub_amount = random.uniform(5, 20)
-                    
-                    # Generate periodic subscription transactions
-                    tx_date = start_date
-                    while tx_date <= end_date:
-                        transactions.append({
-                            "id": str(uuid.uuid4()),
-                            "account_id": account["account_id"],
-                            "transaction_id": f"txn_{fake.uuid4()}",
-                            "date": tx_date,
-                            "amount": -sub_amount,  # Negative - subscription is an expense
-                            "merchant_name": merchant,
-                            "merchant_entity_id": None,
-                            "payment_channel": "online",
-                            "primary_category": "General Merchandise",
-                            "detailed_category": "Subscription",
-                            "pending": False
-                        })
-                        tx_date += timedelta(days=interval_days)
+                # Draw every subscription's frequency and amount at once:
+                # monthly (30 days), bi-monthly (60 days), or 30-day interval
+                sub_intervals = self.rng.choice((30, 60, 30), size=num_subscriptions).tolist()
+                # Subscription amount based on merchant type
+                sub_bounds = np.array(
+                    [self.SUBSCRIPTION_AMOUNT_RANGES.get(merchant, (5, 20)) for merchant in subscription_merchants],
+                    dtype=np.float64
+                ).reshape(-1, 2)
+                sub_amounts = (
+                    sub_bounds[:, 0] + (sub_bounds[:, 1] - sub_bounds[:, 0]) * self.rng.random(num_subscriptions)
+                ).tolist()
+                
+                for merchant, interval_days, sub_amount in zip(subscription_merchants, sub_intervals, sub_amounts):
+                    # Generate periodic subscription transactions (whole schedule at once)
+                    sub_dates = pd.date_range(start_date, end_date, freq=f"{interval_days}D").to_pydatetime()
+                    num_charges = len(sub_dates)
+                    transactions.add_batch(
+                        record_ids=self._id_pool.take(num_charges),
+                        account_id=account_id,
+                        transaction_ids=list(itertools.islice(_transaction_ids, num_charges)),
+                        dates=sub_dates.tolist(),
+                        amounts=[-sub_amount] * num_charges,  # Negative - subscription is an expense
+                        merchant_name=merchant,
+                        payment_channel="online",
+                        primary_category="General Merchandise",
+                        detailed_category="Subscription"
+                    )
                 
                 # Recurring transaction patterns for all users
                 # Starbucks: 2-4 transactions per week
-                starbucks_per_week = random.randint(2, 4)
+                starbucks_per_week = _randint(2, 4)
                 days_between_starbucks = 7.0 / starbucks_per_week  # Distribute evenly across week
-                starbucks_date = start_date
-                while starbucks_date <= end_date:
-                    # Randomize time of day (typical coffee shop hours: 6 AM - 10 PM)
-                    hour = random.randint(6, 22)
-                    minute = random.randint(0, 59)
-                    starbucks_datetime = starbucks_date.replace(hour=hour, minute=minute)
-                    if starbucks_datetime <= end_date:
-                        transactions.append({
-                            "id": str(uuid.uuid4()),
-                            "account_id": account["account_id"],
-                            "transaction_id": f"txn_{fake.uuid4()}",
-                            "date": starbucks_datetime,
-                            "amount": -random.uniform(5.0, 8.0),  # Typical coffee price
-                            "merchant_name": "Starbucks",
-                            "merchant_entity_id": None,
-                            "payment_channel": random.choice(["in store", "online"]),
-                            "primary_category": "Food & Drink",
-                            "detailed_category": "Coffee Shop",
-                            "pending": False
-                        })
-                    starbucks_date += timedelta(days=days_between_starbucks)
+                starbucks_days = pd.date_range(start_date, end_date, freq=pd.Timedelta(days=days_between_starbucks))
+                num_visits = len(starbucks_days)
+                # Randomize time of day (typical coffee shop hours: 6 AM - 10 PM), keeping seconds
+                visit_seconds = self.rng.integers(6, 23, size=num_visits) * 3600 + self.rng.integers(0, 60, size=num_visits) * 60
+                starbucks_datetimes = (
+                    starbucks_days.normalize()
+                    + pd.to_timedelta(visit_seconds, unit="s")
+                    + (starbucks_days - starbucks_days.floor("min"))
+                )
+                visit_amounts = self.rng.uniform(5.0, 8.0, size=num_visits)  # Typical coffee price
+                visit_channels = self.rng.integers(0, 2, size=num_visits)
+                keep = starbucks_datetimes <= end_date
+                num_kept = int(keep.sum())
+                transactions.add_batch(
+                    record_ids=self._id_pool.take(num_kept),
+                    account_id=account_id,
+                    transaction_ids=list(itertools.islice(_transaction_ids, num_kept)),
+                    dates=starbucks_datetimes[keep].to_pydatetime().tolist(),
+                    amounts=(-visit_amounts[keep]).tolist(),
+                    merchant_name="Starbucks",
+                    payment_channel=self.PAYMENT_CHANNELS_IN_STORE_ONLINE[visit_channels[keep]].tolist(),
+                    primary_category="Food & Drink",
+                    detailed_category="Coffee Shop"
+                )
                 
                 # Athletic retailers: 1 transaction per month per retailer
                 # Each user gets 2-4 different athletic retailers
-                athletic_retailers = ["Nike", "Adidas", "Puma", "Reebok", "New Balance"]
-                num_athletic_retailers = random.randint(2, 4)
-                selected_retailers = random.sample(athletic_retailers, num_athletic_retailers)
+                num_athletic_retailers = _randint(2, 4)
+                selected_retailers = _sample(self.ATHLETIC_RETAILERS, num_athletic_retailers)
+                months = _month_starts(start_date, end_date)
+                num_months = len(months)
                 
                 for retailer in selected_retailers:
                     # Determine amount range based on retailer
-                    if retailer == "Nike":
-                        amount_range = (50.0, 200.0)
-                    elif retailer == "Adidas":
-                        amount_range = (50.0, 200.0)
-                    elif retailer == "Puma":
-                        amount_range = (40.0, 150.0)
-                    elif retailer == "Reebok":
-                        amount_range = (40.0, 150.0)
-                    elif retailer == "New Balance":
-                        amount_range = (50.0, 180.0)
-                    else:
-                        amount_range = (50.0, 200.0)
+                    low, high = self.ATHLETIC_AMOUNT_RANGES.get(retailer, (50.0, 200.0))
                     
-                    # Generate monthly transactions
-                    retailer_date = start_date.replace(day=1)  # Start from first of month
-                    while retailer_date <= end_date:
-                        # Randomize date within the month (1-28 to avoid month-end issues)
-                        day_of_month = random.randint(1, 28)
-                        try:
-                            retailer_datetime = retailer_date.replace(day=day_of_month)
-                        except ValueError:
-                            # Handle months with fewer days
-                            retailer_datetime = retailer_date.replace(day=28)
-                        
-                        if retailer_datetime >= start_date and retailer_datetime <= end_date:
-                            transactions.append({
-                                "id": str(uuid.uuid4()),
-                                "account_id": account["account_id"],
-                                "transaction_id": f"txn_{fake.uuid4()}",
-                                "date": retailer_datetime,
-                                "amount": -random.uniform(amount_range[0], amount_range[1]),
-                                "merchant_name": retailer,
-                                "merchant_entity_id": None,
-                                "payment_channel": random.choice(["in store", "online"]),
-                                "primary_category": "Shops",
-                                "detailed_category": "Athletic Wear",
-                                "pending": False
-                            })
-                        # Move to next month
-                        if retailer_date.month == 12:
-                            retailer_date = retailer_date.replace(year=retailer_date.year + 1, month=1, day=1)
-                        else:
-                            retailer_date = retailer_date.replace(month=retailer_date.month + 1, day=1)
+                    # Generate monthly transactions, randomizing the day within each
+                    # month (1-28 to avoid month-end issues)
+                    retailer_datetimes = months + pd.to_timedelta(self.rng.integers(0, 28, size=num_months), unit="D")
+                    retailer_amounts = self.rng.uniform(low, high, size=num_months)
+                    retailer_channels = self.rng.integers(0, 2, size=num_months)
+                    keep = (retailer_datetimes >= start_date) & (retailer_datetimes <= end_date)
+                    num_kept = int(keep.sum())
+                    transactions.add_batch(
+                        record_ids=self._id_pool.take(num_kept),
+                        account_id=account_id,
+                        transaction_ids=list(itertools.islice(_transaction_ids, num_kept)),
+                        dates=retailer_datetimes[keep].to_pydatetime().tolist(),
+                        amounts=(-retailer_amounts[keep]).tolist(),
+                        merchant_name=retailer,
+                        payment_channel=self.PAYMENT_CHANNELS_IN_STORE_ONLINE[retailer_channels[keep]].tolist(),
+                        primary_category="Shops",
+                        detailed_category="Athletic Wear"
+                    )
                 
                 # Uniqlo: 1-2 transactions per month
-                uniqlo_frequency = random.randint(1, 2)  # 1 or 2 times per month
-                uniqlo_date = start_date.replace(day=1)  # Start from first of month
-                while uniqlo_date <= end_date:
-                    for _ in range(uniqlo_frequency):
-                        # Randomize date within the month
-                        day_of_month = random.randint(1, 28)
-                        try:
-                            uniqlo_datetime = uniqlo_date.replace(day=day_of_month)
-                        except ValueError:
-                            # Handle months with fewer days
-                            uniqlo_datetime = uniqlo_date.replace(day=28)
-                        
-                        if uniqlo_datetime >= start_date and uniqlo_datetime <= end_date:
-                            transactions.append({
-                                "id": str(uuid.uuid4()),
-                                "account_id": account["account_id"],
-                                "transaction_id": f"txn_{fake.uuid4()}",
-                                "date": uniqlo_datetime,
-                                "amount": -random.uniform(30.0, 120.0),
-                                "merchant_name": "Uniqlo",
-                                "merchant_entity_id": None,
-                                "payment_channel": random.choice(["in store", "online"]),
-                                "primary_category": "Shops",
-                                "detailed_category": "Clothing",
-                                "pending": False
-                            })
-                    # Move to next month
-                    if uniqlo_date.month == 12:
-                        uniqlo_date = uniqlo_date.replace(year=uniqlo_date.year + 1, month=1, day=1)
-                    else:
-                        uniqlo_date = uniqlo_date.replace(month=uniqlo_date.month + 1, day=1)
+                uniqlo_frequency = _randint(1, 2)  # 1 or 2 times per month
+                uniqlo_months = months.repeat(uniqlo_frequency)
+                num_visits = len(uniqlo_months)
+                # Randomize date within the month
+                uniqlo_datetimes = uniqlo_months + pd.to_timedelta(self.rng.integers(0, 28, size=num_visits), unit="D")
+                uniqlo_amounts = self.rng.uniform(30.0, 120.0, size=num_visits)
+                uniqlo_channels = self.rng.integers(0, 2, size=num_visits)
+                keep = (uniqlo_datetimes >= start_date) & (uniqlo_datetimes <= end_date)
+                num_kept = int(keep.sum())
+                transactions.add_batch(
+                    record_ids=self._id_pool.take(num_kept),
+                    account_id=account_id,
+                    transaction_ids=list(itertools.islice(_transaction_ids, num_kept)),
+                    dates=uniqlo_datetimes[keep].to_pydatetime().tolist(),
+                    amounts=(-uniqlo_amounts[keep]).tolist(),
+                    merchant_name="Uniqlo",
+                    payment_channel=self.PAYMENT_CHANNELS_IN_STORE_ONLINE[uniqlo_channels[keep]].tolist(),
+                    primary_category="Shops",
+                    detailed_category="Clothing"
+                )
             
             # Income transactions (payroll)
             if account_subtype == "checking":
@@ -727,342 +1244,170 @@ class SyntheticDataGenerator:
                     # Variable income: irregular pay gaps (>45 days median) AND low cash buffer
                     # Generate only 2-3 payroll transactions with 45-60 day gaps over 180 days
                     # This ensures median_pay_gap > 45 days
-                    # For variable income, still target around $60-70K yearly but with larger variance
-                    # With 2-3 paychecks over 180 days, each should be larger to maintain similar yearly income
-                    # 3 paychecks: $60K/3 = $20K per paycheck, $70K/3 = $23.3K per paycheck
-                    # 2 paychecks: $60K/2 = $30K per paycheck, $70K/2 = $35K per paycheck
-                    current_date = start_date
-                    num_payrolls = random.randint(2, 3)  # Fewer payrolls = larger gaps
-                    for i in range(num_payrolls):
-                        if num_payrolls == 2:
-                            # 2 paychecks over 180 days: larger amounts to maintain yearly income
-                            # But can also be lower for variable income with low income profile
-                            if financial_profile == "low_income":
-                                amount = random.uniform(14000, 18000)  # Targets $28-35K yearly
-                            else:
-                                amount = random.uniform(28000, 35000)  # Targets $60-70K yearly
-                        else:
-                            # 3 paychecks over 180 days: medium amounts
-                            if financial_profile == "low_income":
-                                amount = random.uniform(9000, 14000)  # Targets $28-35K yearly
-                            else:
-                                amount = random.uniform(18000, 24000)  # Targets $60-70K yearly
-                        transactions.append({
-                            "id": str(uuid.uuid4()),
-                            "account_id": account["account_id"],
-                            "transaction_id": f"txn_{fake.uuid4()}",
-                            "date": current_date,
-                            "amount": amount,
-                            "merchant_name": "PAYROLL DEPOSIT",
-                            "merchant_entity_id": None,
-                            "payment_channel": "other",
-                            "primary_category": "Transfer In",
-                            "detailed_category": "Payroll",
-                            "pending": False
-                        })
-                        # Next payroll in 45-60 days (ensures median > 45)
-                        if i < num_payrolls - 1:  # Don't add days after last payroll
-                            current_date += timedelta(days=random.randint(45, 60))
+                    num_payrolls = _randint(2, 3)  # Fewer payrolls = larger gaps
+                    low, high = self.VARIABLE_PAYCHECK_AMOUNT_RANGES[
+                        (num_payrolls, financial_profile == "low_income")
+                    ]
+                    # Next payroll in 45-60 days (ensures median > 45)
+                    pay_gaps = self.rng.integers(45, 61, size=num_payrolls - 1)
+                    payroll_offsets = np.concatenate(([0], np.cumsum(pay_gaps)))
+                    payroll_dates = (np.datetime64(start_date, "us") + payroll_offsets.astype("timedelta64[D]")).tolist()
+                    payroll_amounts = self.rng.uniform(low, high, size=num_payrolls).tolist()
                 else:
                     # Regular income: bi-weekly or monthly (for all other personas)
-                    # Target median yearly income: $60-70K, minimum: ~$28K
-                    # Bi-weekly (26 paychecks/year): $28K/26=$1,077, $60K/26=$2,308, $70K/26=$2,692 → median ~$2,500
-                    # Monthly (12 paychecks/year): $28K/12=$2,333, $60K/12=$5,000, $70K/12=$5,833 → median ~$5,417
-                    pay_frequency = random.choice(["biweekly", "monthly"])
-                    if pay_frequency == "biweekly":
-                        days_between = 14
-                        # Bi-weekly: range from $28K to $72K+ yearly
-                        # This gives $28,000-$72,800 yearly, median ~$65,000
-                        if financial_profile == "high_income":
-                            amount = random.uniform(2800, 3800)  # $72,800-$98,800 yearly
-                        elif financial_profile == "middle_income":
-                            amount = random.uniform(2200, 2800)  # $57,200-$72,800 yearly (median ~$65K)
-                        elif financial_profile == "variable_income":
-                            # Variable income: high variability but still around median
-                            amount = random.uniform(2000, 3000) * random.uniform(0.8, 1.2)
-                        elif financial_profile == "low_income":
-                            # Low income: target minimum ~$28K yearly
-                            amount = random.uniform(1150, 1900)  # $29,900-$49,400 yearly (min ~$28K)
-                        else:
-                            # Default: mix of low to middle income
-                            amount = random.uniform(1150, 2700)  # $29,900-$70,200 yearly
-                    else:
-                        days_between = 30
-                        # Monthly: range from $28K to $72K+ yearly
-                        # This gives $28,000-$72,000 yearly, median ~$65,000
-                        if financial_profile == "high_income":
-                            amount = random.uniform(6000, 8000)  # $72,000-$96,000 yearly
-                        elif financial_profile == "middle_income":
-                            amount = random.uniform(5000, 5800)  # $60,000-$69,600 yearly (median ~$65K)
-                        elif financial_profile == "variable_income":
-                            # Variable income: high variability but still around median
-                            amount = random.uniform(4500, 6000) * random.uniform(0.8, 1.2)
-                        elif financial_profile == "low_income":
-                            # Low income: target minimum ~$28K yearly
-                            amount = random.uniform(2400, 3600)  # $28,800-$43,200 yearly (min ~$28K)
-                        else:
-                            # Default: mix of low to middle income
-                            amount = random.uniform(2400, 5700)  # $28,800-$68,400 yearly
+                    pay_frequency = _choice(("biweekly", "monthly"))
+                    days_between = 14 if pay_frequency == "biweekly" else 30
+                    low, high = self.PAYCHECK_AMOUNT_RANGES.get(
+                        (pay_frequency, financial_profile),
+                        self.DEFAULT_PAYCHECK_AMOUNT_RANGES[pay_frequency]
+                    )
+                    amount = _uniform(low, high)
+                    if financial_profile == "variable_income":
+                        # Variable income: high variability but still around median
+                        amount *= _uniform(0.8, 1.2)
                     
-                    current_date = start_date
-                    while current_date <= end_date:
-                        transactions.append({
-                            "id": str(uuid.uuid4()),
-                            "account_id": account["account_id"],
-                            "transaction_id": f"txn_{fake.uuid4()}",
-                            "date": current_date,
-                            "amount": amount,
-                            "merchant_name": "PAYROLL DEPOSIT",
-                            "merchant_entity_id": None,
-                            "payment_channel": "other",
-                            "primary_category": "Transfer In",
-                            "detailed_category": "Payroll",
-                            "pending": False
-                        })
-                        current_date += timedelta(days=days_between)
+                    payroll_dates = pd.date_range(start_date, end_date, freq=f"{days_between}D").to_pydatetime().tolist()
+                    payroll_amounts = [amount] * len(payroll_dates)
+                
+                num_payrolls = len(payroll_dates)
+                transactions.add_batch(
+                    record_ids=self._id_pool.take(num_payrolls),
+                    account_id=account_id,
+                    transaction_ids=list(itertools.islice(_transaction_ids, num_payrolls)),
+                    dates=payroll_dates,
+                    amounts=payroll_amounts,
+                    merchant_name="PAYROLL DEPOSIT",
+                    payment_channel="other",
+                    primary_category="Transfer In",
+                    detailed_category="Payroll"
+                )
                 
                 # Expense transactions
-                num_expenses = random.randint(30, 120)  # 30-120 transactions over period
-                expense_txs = []  # Store expense transactions for returns
+                num_expenses = _randint(30, 120)  # 30-120 transactions over period
                 current_balance = account.get("current", 0) or 0
                 
-                for _ in range(num_expenses):
-                    category = random.choice(list(self.MERCHANT_CATEGORIES.keys()))
-                    merchant = random.choice(self.MERCHANT_CATEGORIES[category])
-                    
-                    # Get realistic amount based on category (from transactions_final.csv patterns)
-                    amount = self._get_realistic_amount(category)
-                    
-                    # Ensure transaction doesn't exceed available balance (for checking accounts)
-                    # Leave at least $100 buffer
-                    available_balance = account.get("available", current_balance) or current_balance
-                    if available_balance > 0:
-                        max_amount = max(0, available_balance - 100)
-                        if amount > max_amount:
-                            amount = random.uniform(10, max_amount * 0.8) if max_amount > 10 else max_amount
-                    
-                    # Skip subscription merchants here - they'll be handled separately
-                    if merchant in self.SUBSCRIPTION_MERCHANTS:
-                        continue
-                    
-                    tx_date = fake.date_time_between(start_date=start_date, end_date=end_date)
-                    
-                    # Pending transactions should only be in last 24-48 hours
-                    is_pending = False
-                    now = datetime.now()
-                    hours_ago = (now - tx_date).total_seconds() / 3600
-                    if hours_ago <= 48 and random.random() < 0.15:  # 15% chance if recent
-                        is_pending = True
-                    
-                    tx_data = {
-                        "id": str(uuid.uuid4()),
-                        "account_id": account["account_id"],
-                        "transaction_id": f"txn_{fake.uuid4()}",
-                        "date": tx_date,
-                        "amount": -amount,  # Negative for expenses
-                        "merchant_name": merchant,
-                        "merchant_entity_id": None,
-                        "payment_channel": random.choice(["in store", "online", "other"]),
-                        "primary_category": category,
-                        "detailed_category": category,
-                        "pending": is_pending
-                    }
-                    transactions.append(tx_data)
-                    expense_txs.append(tx_data)  # Store for potential returns
-                
-                # Add returns/partial returns (3-8% of purchases)
-                num_returns = max(1, int(len(expense_txs) * random.uniform(0.03, 0.08)))
-                return_txs = random.sample(expense_txs, min(num_returns, len(expense_txs)))
+                # Draw categories, realistic amounts, merchants, dates and channels for all of them in one batch
+                # (from transactions_final.csv patterns)
+                categories, amounts, merchants, tx_dates, channels, pending = self._sample_purchases(
+                    num_expenses, start_date, end_date
+                )
                 
-                for original_tx in return_txs:
-                    # Return happens 3-30 days after purchase
-                    return_date = original_tx["date"] + timedelta(days=random.randint(3, 30))
-                    
-                    # Skip if return date is beyond end_date
-                    if return_date > end_date:
-                        continue
-                    
-                    # Full return (60% chance) or partial return (40% chance)
-                    if random.random() < 0.6:
-                        # Full return
-                        return_amount = abs(original_tx["amount"])
+                # Ensure transactions don't exceed available balance (for checking accounts)
+                # Leave at least $100 buffer; the balance isn't updated per transaction
+                available_balance = account.get("available", current_balance) or current_balance
+                if available_balance > 0:
+                    max_amount = max(0, available_balance - 100)
+                    over_limit = amounts > max_amount
+                    if max_amount > 10:
+                        amounts[over_limit] = 10 + (max_amount * 0.8 - 10) * self.rng.random(int(over_limit.sum()))
                     else:
-                        # Partial return (40-90% of original)
-                        return_amount = abs(original_tx["amount"]) * random.uniform(0.4, 0.9)
-                    
-                    transactions.append({
-                        "id": str(uuid.uuid4()),
-                        "account_id": account["account_id"],
-                        "transaction_id": f"txn_{fake.uuid4()}",
-                        "date": return_date,
-                        "amount": return_amount,  # Positive - money back
-                        "merchant_name": f"{original_tx['merchant_name']} - RETURN",
-                        "merchant_entity_id": None,
-                        "payment_channel": original_tx["payment_channel"],
-                        "primary_category": original_tx["primary_category"],
-                        "detailed_category": "Return",
-                        "pending": False  # Returns are not pending
-                    })
+                        amounts[over_limit] = max_amount
+                
+                # Skip subscription merchants here - they'll be handled separately
+                keep_list = [merchant not in self._SUBSCRIPTION_MERCHANT_SET for merchant in merchants]
+                keep = np.array(keep_list, dtype=bool)
+                kept_categories = list(itertools.compress(categories, keep_list))
+                num_kept = len(kept_categories)
+                first_row = len(transactions)
+                transactions.add_batch(
+                    record_ids=self._id_pool.take(num_kept),
+                    account_id=account_id,
+                    transaction_ids=list(itertools.islice(_transaction_ids, num_kept)),
+                    dates=list(itertools.compress(tx_dates, keep_list)),
+                    amounts=(-amounts[keep]).tolist(),  # Negative for expenses
+                    merchant_name=list(itertools.compress(merchants, keep_list)),
+                    payment_channel=list(itertools.compress(channels, keep_list)),
+                    primary_category=kept_categories,
+                    detailed_category=kept_categories,
+                    pending=list(itertools.compress(pending, keep_list))
+                )
+                
+                # Add returns/partial returns (3-8% of purchases)
+                self._add_returns(transactions, list(range(first_row, first_row + num_kept)), account_id, end_date)
             
             # Savings transactions (deposits/withdrawals)
             elif account_subtype == "savings":
                 # Persona-specific savings behavior (strict enforcement)
+                deposit_dates = []
                 if persona == "savings_builder":
                     # Savings builder: MUST have regular deposits ≥$200/month to match persona
-                    # Generate monthly deposits of $200-1000
-                    current_date = start_date
-                    while current_date <= end_date:
-                        # Savings builders: $200-1000 monthly deposits (ensures ≥$200/month)
-                        deposit_amount = random.uniform(200, 1000)
-                        transactions.append({
-                            "id": str(uuid.uuid4()),
-                            "account_id": account["account_id"],
-                            "transaction_id": f"txn_{fake.uuid4()}",
-                            "date": current_date,
-                            "amount": deposit_amount,
-                            "merchant_name": "TRANSFER FROM CHECKING",
-                            "merchant_entity_id": None,
-                            "payment_channel": "other",
-                            "primary_category": "Transfer In",
-                            "detailed_category": "Savings",
-                            "pending": False
-                        })
-                        current_date += timedelta(days=random.randint(25, 35))  # Monthly deposits
+                    # Monthly deposits of $200-1000 (ensures ≥$200/month)
+                    deposit_dates = self._random_step_dates(start_date, end_date, 25, 35)
+                    deposit_amounts = self.rng.uniform(200, 1000, size=len(deposit_dates))
                 elif persona == "balanced_stable":
                     # Balanced: moderate savings deposits (but <$200/month to avoid matching savings_builder)
-                    current_date = start_date
-                    while current_date <= end_date:
-                        transactions.append({
-                            "id": str(uuid.uuid4()),
-                            "account_id": account["account_id"],
-                            "transaction_id": f"txn_{fake.uuid4()}",
-                            "date": current_date,
-                            "amount": random.uniform(50, 150),  # <$200/month
-                            "merchant_name": "TRANSFER FROM CHECKING",
-                            "merchant_entity_id": None,
-                            "payment_channel": "other",
-                            "primary_category": "Transfer In",
-                            "detailed_category": "Savings",
-                            "pending": False
-                        })
-                        current_date += timedelta(days=random.randint(14, 30))
+                    deposit_dates = self._random_step_dates(start_date, end_date, 14, 30)
+                    deposit_amounts = self.rng.uniform(50, 150, size=len(deposit_dates))  # <$200/month
                 elif persona == "variable_income_budgeter":
                     # Variable income: minimal savings deposits (irregular income)
-                    current_date = start_date
-                    while current_date <= end_date:
-                        if random.random() < 0.3:  # Only 30% chance of deposits
-                            transactions.append({
-                                "id": str(uuid.uuid4()),
-                                "account_id": account["account_id"],
-                                "transaction_id": f"txn_{fake.uuid4()}",
-                                "date": current_date,
-                                "amount": random.uniform(50, 200),
-                                "merchant_name": "TRANSFER FROM CHECKING",
-                                "merchant_entity_id": None,
-                                "payment_channel": "other",
-                                "primary_category": "Transfer In",
-                                "detailed_category": "Savings",
-                                "pending": False
-                            })
-                        current_date += timedelta(days=random.randint(30, 60))
+                    # Only 30% chance of a deposit at each 30-60 day step
+                    step_dates = self._random_step_dates(start_date, end_date, 30, 60)
+                    deposit_dates = list(itertools.compress(step_dates, (self.rng.random(len(step_dates)) < 0.3).tolist()))
+                    deposit_amounts = self.rng.uniform(50, 200, size=len(deposit_dates))
                 elif financial_profile == "saver":
                     # Legacy saver profile: moderate deposits
-                    current_date = start_date
-                    while current_date <= end_date:
-                        transactions.append({
-                            "id": str(uuid.uuid4()),
-                            "account_id": account["account_id"],
-                            "transaction_id": f"txn_{fake.uuid4()}",
-                            "date": current_date,
-                            "amount": random.uniform(100, 500),
-                            "merchant_name": "TRANSFER FROM CHECKING",
-                            "merchant_entity_id": None,
-                            "payment_channel": "other",
-                            "primary_category": "Transfer In",
-                            "detailed_category": "Savings",
-                            "pending": False
-                        })
-                        current_date += timedelta(days=random.randint(14, 30))
+                    deposit_dates = self._random_step_dates(start_date, end_date, 14, 30)
+                    deposit_amounts = self.rng.uniform(100, 500, size=len(deposit_dates))
+                
+                if deposit_dates:
+                    num_deposits = len(deposit_dates)
+                    transactions.add_batch(
+                        record_ids=self._id_pool.take(num_deposits),
+                        account_id=account_id,
+                        transaction_ids=list(itertools.islice(_transaction_ids, num_deposits)),
+                        dates=deposit_dates,
+                        amounts=deposit_amounts.tolist(),
+                        merchant_name="TRANSFER FROM CHECKING",
+                        payment_channel="other",
+                        primary_category="Transfer In",
+                        detailed_category="Savings"
+                    )
         
         elif account_type == "credit":
             # Credit card transactions
-            num_transactions = random.randint(20, 80)
-            expense_txs = []  # Store for returns
+            num_transactions = _randint(20, 80)
             credit_limit = account.get("limit", 5000)
             current_balance = abs(account.get("current", 0) or 0)
             available_credit = credit_limit - current_balance
             
-            for _ in range(num_transactions):
-                category = random.choice(list(self.MERCHANT_CATEGORIES.keys()))
-                merchant = random.choice(self.MERCHANT_CATEGORIES[category])
-                
-                # Get realistic amount based on category
-                amount = self._get_realistic_amount(category)
-                
-                # Ensure transaction doesn't exceed credit limit
-                # Leave at least $100 of available credit
-                max_amount = max(0, available_credit - 100)
-                if amount > max_amount:
-                    # Scale down to fit within limit
-                    if max_amount > 10:
-                        amount = random.uniform(10, max_amount * 0.8)
-                    else:
-                        continue  # Skip if not enough credit available
-                tx_date = fake.date_time_between(start_date=start_date, end_date=end_date)
-                
-                # Pending transactions should only be in last 24-48 hours
-                is_pending = False
-                now = datetime.now()
-                hours_ago = (now - tx_date).total_seconds() / 3600
-                if hours_ago <= 48 and random.random() < 0.15:  # 15% chance if recent
-                    is_pending = True
-                
-                tx_data = {
-                    "id": str(uuid.uuid4()),
-                    "account_id": account["account_id"],
-                    "transaction_id": f"txn_{fake.uuid4()}",
-                    "date": tx_date,
-                    "amount": -amount,  # Negative for credit card charges
-                    "merchant_name": merchant,
-                    "merchant_entity_id": None,
-                    "payment_channel": random.choice(["in store", "online", "other"]),
-                    "primary_category": category,
-                    "detailed_category": category,
-                    "pending": is_pending
-                }
-                transactions.append(tx_data)
-                expense_txs.append(tx_data)
+            # Draw categories, realistic amounts, merchants, dates and channels for all of them in one batch
+            categories, amounts, merchants, tx_dates, channels, pending = self._sample_purchases(
+                num_transactions, start_date, end_date
+            )
             
-            # Add returns for credit cards (3-8% of purchases)
-            num_returns = max(1, int(len(expense_txs) * random.uniform(0.03, 0.08)))
-            return_txs = random.sample(expense_txs, min(num_returns, len(expense_txs)))
+            # Ensure transactions don't exceed credit limit
+            # Leave at least $100 of available credit: scale oversized purchases down to fit,
+            # or skip them if not enough credit is available
+            max_amount = max(0, available_credit - 100)
+            over_limit = amounts > max_amount
+            if max_amount > 10:
+                amounts[over_limit] = 10 + (max_amount * 0.8 - 10) * self.rng.random(int(over_limit.sum()))
+                keep = np.ones(num_transactions, dtype=bool)
+            else:
+                keep = ~over_limit
             
-            for original_tx in return_txs:
-                return_date = original_tx["date"] + timedelta(days=random.randint(3, 30))
-                if return_date > end_date:
-                    continue
-                
-                if random.random() < 0.6:
-                    return_amount = abs(original_tx["amount"])
-                else:
-                    return_amount = abs(original_tx["amount"]) * random.uniform(0.4, 0.9)
-                
-                transactions.append({
-                    "id": str(uuid.uuid4()),
-                    "account_id": account["account_id"],
-                    "transaction_id": f"txn_{fake.uuid4()}",
-                    "date": return_date,
-                    "amount": return_amount,  # Positive - credit back
-                    "merchant_name": f"{original_tx['merchant_name']} - RETURN",
-                    "merchant_entity_id": None,
-                    "payment_channel": original_tx["payment_channel"],
-                    "primary_category": original_tx["primary_category"],
-                    "detailed_category": "Return",
-                    "pending": False
-                })
+            # Emit the purchases and their returns (3-8% of purchases) from the same batch
+            keep_list = keep.tolist()
+            kept_categories = list(itertools.compress(categories, keep_list))
+            num_kept = len(kept_categories)
+            first_row = len(transactions)
+            transactions.add_batch(
+                record_ids=self._id_pool.take(num_kept),
+                account_id=account_id,
+                transaction_ids=list(itertools.islice(_transaction_ids, num_kept)),
+                dates=list(itertools.compress(tx_dates, keep_list)),
+                amounts=(-amounts[keep]).tolist(),  # Negative for credit card charges
+                merchant_name=list(itertools.compress(merchants, keep_list)),
+                payment_channel=list(itertools.compress(channels, keep_list)),
+                primary_category=kept_categories,
+                detailed_category=kept_categories,
+                pending=list(itertools.compress(pending, keep_list))
+            )
+            self._add_returns(transactions, list(range(first_row, first_row + num_kept)), account_id, end_date)
             
             # Get liability for this account to determine payment behavior
-            liability = next((l for l in self.liabilities if l.get("account_id") == account["account_id"]), None)
+            if liability is None:
+                liability = next((l for l in self.liabilities if l.get("account_id") == account_id), None)
             minimum_payment = liability["minimum_payment_amount"] if liability else account.get("minimum_payment_due", 25.0)
             balance = account.get("current", 1000)
             
@@ -1072,45 +1417,45 @@ class SyntheticDataGenerator:
                 payment_behavior = "minimum_only" if abs(liability["last_payment_amount"] - liability["minimum_payment_amount"]) < 0.01 else "variable"
             else:
                 # Fallback: use profile-based logic
-                payment_behavior = "minimum_only" if financial_profile == "high_utilization" and random.random() < 0.7 else "variable"
+                payment_behavior = "minimum_only" if financial_profile == "high_utilization" and _rand() < 0.7 else "variable"
             
             # Generate monthly payment (align with next_payment_due_date if available)
+            payment_period = DAY_DELTAS[30]
             if liability and liability.get("next_payment_due_date"):
                 payment_date = liability["next_payment_due_date"]
-                # Adjust to be within our date window
-                while payment_date < start_date:
-                    payment_date -= timedelta(days=30)
-                while payment_date > end_date:
-                    payment_date -= timedelta(days=30)
+                # Adjust to be within our date window by whole 30-day periods
+                if payment_date < start_date:
+                    payment_date += payment_period * -((payment_date - start_date) // payment_period)
+                elif payment_date > end_date:
+                    payment_date -= payment_period * -((end_date - payment_date) // payment_period)
             else:
-                payment_date = start_date + timedelta(days=random.randint(1, 15))  # Random date in first half of month
+                payment_date = start_date + DAY_DELTAS[_randint(1, 15)]  # Random date in first half of month
             
-            while payment_date <= end_date:
-                if payment_behavior == "minimum_only":
-                    # Always pay exactly minimum (for detection)
-                    payment_amount = minimum_payment
-                else:
-                    # Variable payments: sometimes minimum, sometimes more
-                    if random.random() < 0.4:  # 40% chance of minimum payment
-                        payment_amount = minimum_payment
-                    else:
-                        # Pay between minimum and balance
-                        payment_amount = random.uniform(minimum_payment * 1.2, min(balance * 0.8, minimum_payment * 10))
-                
-                transactions.append({
-                    "id": str(uuid.uuid4()),
-                    "account_id": account["account_id"],
-                    "transaction_id": f"txn_{fake.uuid4()}",
-                    "date": payment_date,
-                    "amount": payment_amount,  # Positive - payment reduces balance
-                    "merchant_name": "CREDIT CARD PAYMENT",
-                    "merchant_entity_id": None,
-                    "payment_channel": "online",
-                    "primary_category": "Transfer Out",
-                    "detailed_category": "Payment",
-                    "pending": False
-                })
-                payment_date += timedelta(days=30)
+            payment_dates = pd.date_range(payment_date, end_date, freq="30D").to_pydatetime().tolist()
+            num_payments = len(payment_dates)
+            if payment_behavior == "minimum_only":
+                # Always pay exactly minimum (for detection)
+                payment_amounts = [minimum_payment] * num_payments
+            else:
+                # Variable payments: 40% chance of minimum payment, otherwise pay between minimum and balance
+                low, high = minimum_payment * 1.2, min(balance * 0.8, minimum_payment * 10)
+                payment_amounts = np.where(
+                    self.rng.random(num_payments) < 0.4,
+                    minimum_payment,
+                    low + (high - low) * self.rng.random(num_payments)
+                ).tolist()
+            
+            transactions.add_batch(
+                record_ids=self._id_pool.take(num_payments),
+                account_id=account_id,
+                transaction_ids=list(itertools.islice(_transaction_ids, num_payments)),
+                dates=payment_dates,
+                amounts=payment_amounts,  # Positive - payment reduces balance
+                merchant_name="CREDIT CARD PAYMENT",
+                payment_channel="online",
+                primary_category="Transfer Out",
+                detailed_category="Payment"
+            )
             
             # Add interest charges (monthly, if balance > 0)
             # Only high_utilization persona should have interest charges to ensure they match
@@ -1118,73 +1463,121 @@ class SyntheticDataGenerator:
                 apr = liability["apr_percentage"] if liability else 25.0
                 monthly_interest_rate = apr / 12.0 / 100.0
                 
-                interest_date = start_date
-                while interest_date <= end_date:
-                    # Interest charge = balance * monthly rate
-                    interest_amount = balance * monthly_interest_rate
-                    
-                    transactions.append({
-                        "id": str(uuid.uuid4()),
-                        "account_id": account["account_id"],
-                        "transaction_id": f"txn_{fake.uuid4()}",
-                        "date": interest_date,
-                        "amount": -interest_amount,  # Negative - interest charge
-                        "merchant_name": "INTEREST CHARGE",
-                        "merchant_entity_id": None,
-                        "payment_channel": "other",
-                        "primary_category": "Interest",
-                        "detailed_category": "Interest Charge",
-                        "pending": False
-                    })
-                    interest_date += timedelta(days=30)
+                # Interest charge = balance * monthly rate, every 30 days
+                interest_dates = pd.date_range(start_date, end_date, freq="30D").to_pydatetime().tolist()
+                num_charges = len(interest_dates)
+                transactions.add_batch(
+                    record_ids=self._id_pool.take(num_charges),
+                    account_id=account_id,
+                    transaction_ids=list(itertools.islice(_transaction_ids, num_charges)),
+                    dates=interest_dates,
+                    amounts=[-balance * monthly_interest_rate] * num_charges,  # Negative - interest charge
+                    merchant_name="INTEREST CHARGE",
+                    payment_channel="other",
+                    primary_category="Interest",
+                    detailed_category="Interest Charge"
+                )
         
         elif account_type == "loan":
             # Loan payment transactions (monthly payments)
-            if account_subtype == "mortgage":
-                # Monthly mortgage payments - NEGATIVE (money going out)
-                current_date = start_date
-                while current_date <= end_date:
-                    # Typical mortgage payment: $800-$2000
-                    payment_amount = random.uniform(800, 2000)
-                    transactions.append({
-                        "id": str(uuid.uuid4()),
-                        "account_id": account["account_id"],
-                        "transaction_id": f"txn_{fake.uuid4()}",
-                        "date": current_date,
-                        "amount": -payment_amount,  # Negative - money going out (expense)
-                        "merchant_name": "MORTGAGE PAYMENT",
-                        "merchant_entity_id": None,
-                        "payment_channel": "online",
-                        "primary_category": "Transfer Out",
-                        "detailed_category": "Loan Payment",
-                        "pending": False
-                    })
-                    current_date += timedelta(days=30)  # Monthly payments
-            
-            elif account_subtype == "student_loan":
-                # Monthly student loan payments - NEGATIVE (money going out)
-                current_date = start_date
-                while current_date <= end_date:
-                    # Typical student loan payment: $100-$600
-                    payment_amount = random.uniform(100, 600)
-                    transactions.append({
-                        "id": str(uuid.uuid4()),
-                        "account_id": account["account_id"],
-                        "transaction_id": f"txn_{fake.uuid4()}",
-                        "date": current_date,
-                        "amount": -payment_amount,  # Negative - money going out (expense)
-                        "merchant_name": "STUDENT LOAN PAYMENT",
-                        "merchant_entity_id": None,
-                        "payment_channel": "online",
-                        "primary_category": "Transfer Out",
-                        "detailed_category": "Loan Payment",
-                        "pending": False
-                    })
-                    current_date += timedelta(days=30)  # Monthly payments
+            if account_subtype in self.LOAN_PAYMENTS:
+                merchant_name, (low, high) = self.LOAN_PAYMENTS[account_subtype]
+                # Every 30 days over the window, amounts for the whole schedule at once
+                payment_dates = pd.date_range(start_date, end_date, freq="30D").to_pydatetime().tolist()
+                num_payments = len(payment_dates)
+                transactions.add_batch(
+                    record_ids=self._id_pool.take(num_payments),
+                    account_id=account_id,
+                    transaction_ids=list(itertools.islice(_transaction_ids, num_payments)),
+                    dates=payment_dates,
+                    amounts=(-self.rng.uniform(low, high, size=num_payments)).tolist(),  # Negative - money going out (expense)
+                    merchant_name=merchant_name,
+                    payment_channel="online",
+                    primary_category="Transfer Out",
+                    detailed_category="Loan Payment"
+                )
         
         return transactions
     
-    def generate_all(self) -> Dict[str, List[Dict[str, Any]]]:
+    def _random_step_dates(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        min_days: int,
+        max_days: int
+    ) -> List[datetime]:
+        """Dates from start_date onwards, each a random min_days-max_days days after the last.
+        
+        All steps that could fit in the window are drawn at once and the
+        dates past end_date are dropped.
+        
+        Args:
+            start_date: First date
+            end_date: Last allowed date
+            min_days: Shortest step in days
+            max_days: Longest step in days (inclusive)
+        
+        Returns:
+            List of datetimes
+        """
+        max_steps = max((end_date - start_date).days // min_days, 0)
+        offsets = np.concatenate(([0], np.cumsum(self.rng.integers(min_days, max_days + 1, size=max_steps))))
+        dates = np.datetime64(start_date, "us") + offsets.astype("timedelta64[D]")
+        return dates[dates <= np.datetime64(end_date, "us")].tolist()
+    
+    def _add_returns(
+        self,
+        transactions: _TransactionColumns,
+        expense_rows: List[int],
+        account_id: str,
+        end_date: datetime
+    ):
+        """Add full and partial returns for 3-8% of an account's purchases.
+        
+        The returned purchases, return delays and refund amounts are drawn for
+        all returns at once.
+        
+        Args:
+            transactions: The account's transactions
+            expense_rows: Rows of the purchases that can be returned
+            account_id: Account the returns are credited to
+            end_date: End of the transaction window
+        """
+        if not expense_rows:
+            return
+        num_returns = min(max(1, int(len(expense_rows) * self._rng.uniform(0.03, 0.08))), len(expense_rows))
+        rows = np.asarray(expense_rows)[self.rng.choice(len(expense_rows), size=num_returns, replace=False)]
+        columns = transactions.columns
+        
+        # Return happens 3-30 days after purchase; skip returns beyond end_date
+        purchase_dates = np.array([columns["date"][row] for row in rows], dtype="datetime64[us]")
+        return_dates = purchase_dates + self.rng.integers(3, 31, size=num_returns).astype("timedelta64[D]")
+        keep = return_dates <= np.datetime64(end_date, "us")
+        
+        # Full return (60% chance) or partial return (40-90% of original); positive - money back
+        purchase_amounts = np.abs([columns["amount"][row] for row in rows])
+        return_amounts = np.where(
+            self.rng.random(num_returns) < 0.6,
+            purchase_amounts,
+            purchase_amounts * self.rng.uniform(0.4, 0.9, size=num_returns)
+        )
+        
+        rows = rows[keep].tolist()
+        num_kept = len(rows)
+        transactions.add_batch(
+            record_ids=self._id_pool.take(num_kept),
+            account_id=account_id,
+            transaction_ids=list(itertools.islice(self._transaction_ids, num_kept)),
+            dates=return_dates[keep].tolist(),
+            amounts=return_amounts[keep].tolist(),
+            merchant_name=[sys.intern(f"{columns['merchant_name'][row]} - RETURN") for row in rows],
+            payment_channel=[columns["payment_channel"][row] for row in rows],
+            primary_category=[columns["primary_category"][row] for row in rows],
+            detailed_category="Return",
+            pending=False  # Returns are not pending
+        )
+    
+    def generate_all(self) -> Dict[str, Any]:
         """Generate all synthetic data with persona-based distribution.
         
         Persona distribution for 100 users:
@@ -1215,38 +1608,94 @@ class SyntheticDataGenerator:
             persona_assignments.append("balanced_stable")
         
         # Shuffle to randomize order
-        random.shuffle(persona_assignments)
+        self._rng.shuffle(persona_assignments)
         
-        end_date = datetime.now()
+        end_date = self._now
         start_date = end_date - timedelta(days=180)  # Last 180 days of data for proper persona detection
         
-        for i in range(self.num_users):
-            # Assign persona-based profile
-            persona = persona_assignments[i]
-            profile = self._map_persona_to_profile(persona)
-            
-            # Generate user
-            user = self.generate_user()
-            self.users.append(user)
-            
-            # Generate accounts with persona-specific settings
-            accounts = self.generate_accounts(user["id"], profile, persona)
-            self.accounts.extend(accounts)
-            
-            # Generate transactions for each account
-            for account in accounts:
-                transactions = self.generate_transactions(
-                    account, start_date, end_date, profile, persona
+        # Assign persona-based profiles and the 2-account flags up front so that
+        # users can be generated independently of each other
+        user_specs = list(zip(
+            persona_assignments,
+            [self._map_persona_to_profile(persona) for persona in persona_assignments],
+            self._low_risk_two_account_flags(persona_assignments)
+        ))
+        
+        if self.workers > 1 and len(user_specs) > 1:
+            # Split users into one contiguous batch per worker, each with its own seed
+            num_batches = min(self.workers, len(user_specs))
+            batch_size = -(-len(user_specs) // num_batches)
+            batches = [user_specs[i:i + batch_size] for i in range(0, len(user_specs), batch_size)]
+            seeds = [self._rng.getrandbits(64) for _ in batches]
+            with ProcessPoolExecutor(max_workers=num_batches) as executor:
+                results = executor.map(
+                    _generate_user_batch,
+                    batches,
+                    [start_date] * len(batches),
+                    [end_date] * len(batches),
+                    seeds
                 )
-                self.transactions.extend(transactions)
+                for result in results:
+                    # Batches only dedupe emails among themselves
+                    for user in result["users"]:
+                        user["email"] = self._claim_email(user["email"])
+                    self.users.extend(result["users"])
+                    self.accounts.extend(result["accounts"])
+                    self.transactions.extend_columns(result["transactions"])
+                    self.liabilities.extend(result["liabilities"])
+        else:
+            for persona, profile, low_risk_two_accounts in user_specs:
+                self._generate_single_user(persona, profile, low_risk_two_accounts, start_date, end_date)
         
         return {
             "users": self.users,
             "accounts": self.accounts,
-            "transactions": self.transactions,
+            "transactions": self.transactions.to_frame(),
             "liabilities": self.liabilities
         }
     
+    def _generate_single_user(
+        self,
+        persona: str,
+        profile: str,
+        low_risk_two_accounts: bool,
+        start_date: datetime,
+        end_date: datetime
+    ):
+        """Generate one user with their accounts, liabilities and transactions."""
+        user = self.generate_user()
+        self.users.append(user)
+        
+        # Generate accounts with persona-specific settings
+        num_liabilities = len(self.liabilities)
+        accounts = self.generate_accounts(user["id"], profile, persona, low_risk_two_accounts)
+        self.accounts.extend(accounts)
+        
+        # This user's liabilities by account, instead of scanning all liabilities per account
+        user_liabilities = {
+            liability["account_id"]: liability for liability in self.liabilities[num_liabilities:]
+        }
+        
+        # Generate transactions for each account
+        for account in accounts:
+            transactions = self.generate_transactions(
+                account, start_date, end_date, profile, persona,
+                liability=user_liabilities.get(account["account_id"])
+            )
+            self.transactions.extend_columns(transactions.columns)
+    
+    @staticmethod
+    def _low_risk_two_account_flags(persona_assignments: List[str]) -> List[bool]:
+        """Flag the first 2 savings_builder/balanced_stable users for exactly 2 accounts."""
+        flags = []
+        remaining = 2
+        for persona in persona_assignments:
+            flag = remaining > 0 and persona in ("savings_builder", "balanced_stable")
+            if flag:
+                remaining -= 1
+            flags.append(flag)
+        return flags
+    
     def _map_persona_to_profile(self, persona: str) -> str:
         """Map persona to financial profile for backward compatibility."""
         # Map personas to income profiles with weighted distribution:
@@ -1254,11 +1703,8 @@ class SyntheticDataGenerator:
         # - ~60-70% middle_income (to maintain median ~$60-70K)
         # - ~15-20% high_income (for range)
         
-        # Use a counter to ensure we get roughly the right distribution across all users
-        if not hasattr(self, '_profile_counter'):
-            self._profile_counter = {"low": 0, "middle": 0, "high": 0}
-        
-        rand = random.random()
+        # Use a counter (see __init__) to ensure we get roughly the right distribution across all users
+        rand = self._rng.random()
         
         # First 10-15% of users should be low_income to hit minimum
         if self._profile_counter["low"] < (self.num_users * 0.15):
@@ -1284,7 +1730,7 @@ class SyntheticDataGenerator:
         else:
             return "high_income"
     
-    def _generate_from_csv(self) -> Dict[str, List[Dict[str, Any]]]:
+    def _generate_from_csv(self) -> Dict[str, Any]:
         """Generate data using transactions_final.csv as source for transaction values."""
         import os
         
@@ -1296,7 +1742,8 @@ class SyntheticDataGenerator:
         
         # Sample transactions from CSV (use up to 1000 transactions)
         max_transactions = min(1000, len(df))
-        sampled_df = df.sample(n=max_transactions, random_state=42).reset_index(drop=True)
+        sample_rows = np.random.default_rng(42).choice(len(df), size=max_transactions, replace=False)
+        sampled_df = df.iloc[sample_rows].reset_index(drop=True)
         
         # Generate users and accounts first
         financial_profiles = [
@@ -1320,298 +1767,307 @@ class SyntheticDataGenerator:
         while len(persona_assignments) < self.num_users:
             persona_assignments.append("balanced_stable")
         
-        random.shuffle(persona_assignments)
+        self._rng.shuffle(persona_assignments)
         
+        low_risk_flags = self._low_risk_two_account_flags(persona_assignments)
         for i in range(self.num_users):
             persona = persona_assignments[i]
             profile = self._map_persona_to_profile(persona)
             user = self.generate_user()
             self.users.append(user)
             
-            accounts = self.generate_accounts(user["id"], profile, persona)
+            accounts = self.generate_accounts(user["id"], profile, persona, low_risk_flags[i])
             self.accounts.extend(accounts)
         
         # Map CSV transactions to our accounts
         # Group transactions by customer_id from CSV to distribute across our users
-        user_accounts = {}  # user_id -> list of accounts
+        user_accounts = {user["id"]: [] for user in self.users}  # user_id -> list of accounts
+        for acc in self.accounts:
+            user_accounts[acc["user_id"]].append(acc["account_id"])
         
-        for user in self.users:
-            user_accounts[user["id"]] = [
-                acc for acc in self.accounts if acc["user_id"] == user["id"]
-            ]
+        # Distribute CSV transactions across our users in round-robin fashion,
+        # moving to the next user after transactions_per_user transactions
+        num_rows = len(sampled_df)
+        transactions_per_user = max(num_rows // self.num_users, 1)
+        user_indices = (np.arange(num_rows) // transactions_per_user) % self.num_users
+        account_lists = [user_accounts[user["id"]] for user in self.users]
+        account_counts = np.array([len(account_list) for account_list in account_lists])
         
-        # Distribute CSV transactions across our users
-        transactions_per_user = len(sampled_df) // self.num_users
-        user_idx = 0
+        # Skip transactions assigned to users without accounts
+        has_accounts = account_counts[user_indices] > 0
+        row_indices = np.flatnonzero(has_accounts)
+        user_indices = user_indices[has_accounts]
+        sampled_df = sampled_df.iloc[row_indices]
         
-        for idx, row in sampled_df.iterrows():
-            # Assign to user in round-robin fashion
-            if user_idx >= self.num_users:
-                user_idx = 0
-            
-            user = self.users[user_idx]
-            user_accounts_list = user_accounts[user["id"]]
-            
-            if not user_accounts_list:
-                user_idx += 1
-                continue
-            
-            # Select an account (prefer checking/credit for transactions)
-            account = random.choice(user_accounts_list)
-            
-            # Parse date from CSV
-            try:
-                tx_date = pd.to_datetime(row['timestamp'])
-            except:
-                tx_date = pd.to_datetime(row['date'])
-            
-            # Map CSV columns to our transaction format
-            # Determine amount sign based on transaction_type
-            amount = float(row['amount'])
-            if row['transaction_type'] in ['purchase', 'fee', 'withdrawal']:
-                amount = -abs(amount)  # Negative for expenses
-            elif row['transaction_type'] in ['deposit', 'refund']:
-                amount = abs(amount)  # Positive for income/returns
-            elif row['transaction_type'] == 'transfer':
-                # For transfers, check if it's outgoing (negative) or incoming (positive)
-                # Assume outgoing for now (can be refined)
-                amount = -abs(amount)
-            
-            # Map merchant_category to our category format
-            merchant_category = str(row['merchant_category']).replace('_', ' ').title()
-            primary_category = merchant_category
-            
+        # Select an account for each transaction
+        account_picks = self.rng.integers(0, account_counts[user_indices])
+        account_ids = [
+            account_lists[user_idx][pick] for user_idx, pick in zip(user_indices.tolist(), account_picks.tolist())
+        ]
+        
+        # Parse dates from CSV (timestamp, falling back to date)
+        tx_dates = pd.to_datetime(sampled_df["date"], errors="coerce") if "date" in sampled_df else None
+        if "timestamp" in sampled_df:
+            timestamps = pd.to_datetime(sampled_df["timestamp"], errors="coerce")
+            tx_dates = timestamps if tx_dates is None else timestamps.fillna(tx_dates)
+        
+        # Map CSV columns to our transaction format
+        # Determine amount sign based on transaction_type: negative for expenses and
+        # (assumed outgoing) transfers, positive for income/returns
+        amounts = sampled_df["amount"].astype(float)
+        transaction_types = sampled_df["transaction_type"]
+        amounts = amounts.mask(
+            transaction_types.isin(["purchase", "fee", "withdrawal", "transfer"]), -amounts.abs()
+        ).mask(transaction_types.isin(["deposit", "refund"]), amounts.abs())
+        
+        # Map merchant_category to our category format
+        primary_categories = sampled_df["merchant_category"].astype(str).str.replace("_", " ").str.title()
+        
+        # Map payment_method to payment_channel
+        payment_methods = sampled_df["payment_method"].astype(str).str.lower()
+        payment_channels = np.select(
+            [
+                payment_methods.str.contains("credit", regex=False),
+                payment_methods.str.contains("debit", regex=False),
+                payment_methods.str.contains("digital|wallet"),
+            ],
+            ["online", "in store", "online"],
+            default="other"
+        )
+        
+        # Generate merchant name if not present
+        if "merchant_id" in sampled_df:
+            merchant_entity_ids = sampled_df["merchant_id"].astype(str)
+        else:
+            merchant_entity_ids = pd.Series("", index=sampled_df.index)
+        merchant_names = "Merchant " + merchant_entity_ids
+        if "merchant_name" in sampled_df:
+            csv_names = sampled_df["merchant_name"]
+            merchant_names = csv_names.astype(str).where(csv_names.notna(), merchant_names)
+        
+        num_kept = len(row_indices)
+        self.transactions.extend_columns({
+            "id": self._id_pool.take(num_kept),
+            "account_id": account_ids,
+            "transaction_id": [f"txn_{idx:08d}" for idx in row_indices.tolist()],
+            "date": tx_dates.tolist(),
+            "amount": amounts.tolist(),
+            "merchant_name": merchant_names.tolist(),
+            "merchant_entity_id": merchant_entity_ids.tolist(),
+            "payment_channel": payment_channels.tolist(),
+            "primary_category": primary_categories.tolist(),
+            "detailed_category": primary_categories.tolist(),
             # Determine pending status
-            pending = row['status'] == 'pending'
-            
-            # Map payment_method to payment_channel
-            payment_method = str(row['payment_method']).lower()
-            if 'credit' in payment_method:
-                payment_channel = 'online'
-            elif 'debit' in payment_method:
-                payment_channel = 'in store'
-            elif 'digital' in payment_method or 'wallet' in payment_method:
-                payment_channel = 'online'
-            else:
-                payment_channel = 'other'
-            
-            # Generate merchant name if not present
-            merchant_name = f"Merchant {row['merchant_id']}" if pd.isna(row.get('merchant_name')) else str(row.get('merchant_name', 'Unknown'))
-            
-            transaction = {
-                "id": str(uuid.uuid4()),
-                "account_id": account["account_id"],
-                "transaction_id": f"txn_{idx:08d}",
-                "date": tx_date,
-                "amount": amount,
-                "merchant_name": merchant_name,
-                "merchant_entity_id": str(row.get('merchant_id', '')),
-                "payment_channel": payment_channel,
-                "primary_category": primary_category,
-                "detailed_category": primary_category,
-                "pending": pending
-            }
-            
-            self.transactions.append(transaction)
-            
-            # Move to next user after transactions_per_user transactions
-            if (idx + 1) % transactions_per_user == 0:
-                user_idx += 1
+            "pending": (sampled_df["status"] == "pending").tolist(),
+        })
         
         print(f"Generated {len(self.users)} users, {len(self.accounts)} accounts, {len(self.transactions)} transactions from CSV")
         
         return {
             "users": self.users,
             "accounts": self.accounts,
-            "transactions": self.transactions,
+            "transactions": self.transactions.to_frame(),
             "liabilities": self.liabilities
         }
     
-    def _get_amount_category(self, amount: float) -> str:
-        """Get amount category based on absolute value."""
-        abs_amount = abs(amount)
-        if abs_amount < 15:
-            return "small"
-        elif abs_amount < 50:
-            return "medium"
-        elif abs_amount < 100:
-            return "large"
-        elif abs_amount < 200:
-            return "very_large"
-        else:
-            return "extra_large"
+    def _get_amount_categories(self, amounts: pd.Series) -> pd.Series:
+        """Get amount category for each amount based on absolute value."""
+        return pd.cut(
+            amounts.abs(),
+            bins=[-np.inf, 15, 50, 100, 200, np.inf],
+            labels=["small", "medium", "large", "very_large", "extra_large"],
+            right=False
+        ).astype(str)
     
-    def _get_transaction_type(self, merchant_name: str, detailed_category: str, amount: float) -> str:
-        """Determine transaction type from transaction details."""
-        if "RETURN" in merchant_name or detailed_category == "Return":
-            return "refund"
-        elif "PAYROLL" in merchant_name or detailed_category == "Payroll":
-            return "deposit"
-        elif "PAYMENT" in merchant_name or detailed_category == "Payment":
-            return "transfer"
-        elif "INTEREST CHARGE" in merchant_name or "FEE" in merchant_name:
-            return "fee"
-        elif "TRANSFER" in merchant_name:
-            return "transfer"
-        elif amount < 0:
-            return "purchase"
-        elif amount > 0 and "WITHDRAWAL" not in merchant_name:
-            return "deposit"
-        else:
-            return "withdrawal"
+    def _get_transaction_types(
+        self,
+        merchant_names: pd.Series,
+        detailed_categories: pd.Series,
+        amounts: pd.Series
+    ) -> np.ndarray:
+        """Determine transaction type for each transaction from its details.
+        
+        Conditions are checked in priority order; the first one that holds
+        decides the type.
+        """
+        merchant_names = merchant_names.astype(str)
+        detailed_categories = detailed_categories.astype(str)
+        
+        def mentions(text: str) -> pd.Series:
+            return merchant_names.str.contains(text, regex=False)
+        
+        conditions = [
+            mentions("RETURN") | (detailed_categories == "Return"),
+            mentions("PAYROLL") | (detailed_categories == "Payroll"),
+            mentions("PAYMENT") | (detailed_categories == "Payment"),
+            mentions("INTEREST CHARGE") | mentions("FEE"),
+            mentions("TRANSFER"),
+            amounts < 0,
+            (amounts > 0) & ~mentions("WITHDRAWAL"),
+        ]
+        choices = ["refund", "deposit", "transfer", "fee", "transfer", "purchase", "deposit"]
+        return np.select(conditions, choices, default="withdrawal")
     
-    def _map_payment_channel_to_method(self, payment_channel: str, account_type: str) -> str:
-        """Map payment_channel to payment_method format."""
-        if account_type == "credit":
-            return "credit_card"
-        elif payment_channel == "online":
-            return "digital_wallet"
-        elif payment_channel == "in store":
-            return "debit_card"
-        elif payment_channel == "other":
-            return "bank_transfer"
-        else:
-            return "debit_card"  # default
+    def _map_payment_channels_to_methods(
+        self,
+        payment_channels: pd.Series,
+        account_types: pd.Series
+    ) -> np.ndarray:
+        """Map payment_channel to payment_method format (credit accounts always use credit_card)."""
+        methods = payment_channels.astype(object).map(self.PAYMENT_CHANNEL_METHODS).fillna("debit_card")  # default
+        return np.where(account_types == "credit", "credit_card", methods)
     
-    def _generate_merchant_id(self, merchant_name: str) -> str:
-        """Generate a merchant ID from merchant name."""
-        # Create consistent merchant IDs based on name
-        merchant_id_map = getattr(self, '_merchant_id_map', {})
-        if merchant_name not in merchant_id_map:
-            merchant_id_map[merchant_name] = f"MERCH{len(merchant_id_map):06d}"
-        self._merchant_id_map = merchant_id_map
-        return merchant_id_map[merchant_name]
+    def _generate_merchant_ids(self, merchant_names: pd.Series) -> pd.Series:
+        """Generate a merchant ID for each merchant name."""
+        # Create consistent merchant IDs based on name: new names are numbered
+        # in order of first appearance, once per distinct name
+        merchant_id_map = self._merchant_id_map
+        for merchant_name in pd.unique(merchant_names.astype(object)):
+            if merchant_name not in merchant_id_map:
+                merchant_id_map[merchant_name] = f"MERCH{len(merchant_id_map):06d}"
+        return merchant_names.astype(object).map(merchant_id_map)
     
     def save_to_csv(self, output_dir: str = "data/synthetic"):
         """Save generated data to CSV files matching transactions_final.csv format."""
         import os
-        from collections import defaultdict
         
         os.makedirs(output_dir, exist_ok=True)
         
         # Save users, accounts, liabilities as before
         pd.DataFrame(self.users).to_csv(f"{output_dir}/users.csv", index=False)
-        pd.DataFrame(self.accounts).to_csv(f"{output_dir}/accounts.csv", index=False)
+        accounts_df = pd.DataFrame(self.accounts)
+        accounts_df.to_csv(f"{output_dir}/accounts.csv", index=False)
         pd.DataFrame(self.liabilities).to_csv(f"{output_dir}/liabilities.csv", index=False)
         
-        # Create account lookup for account_id -> account details
-        account_lookup = {acc["account_id"]: acc for acc in self.accounts}
-        user_lookup = {acc["user_id"]: acc for acc in self.accounts}
+        # Create account_id -> user_id and user_id -> customer_id mappings (for dashboard consistency)
+        account_to_user = {acc["account_id"]: acc["user_id"] for acc in self.accounts}
+        user_id_to_customer = {user["id"]: f"CUST{idx:06d}" for idx, user in enumerate(self.users, 1)}
         
-        # Create user_id -> customer_id mapping (for dashboard consistency)
-        user_id_to_customer = {}
-        for idx, user in enumerate(self.users, 1):
-            user_id_to_customer[user["id"]] = f"CUST{idx:06d}"
+        # Sort transactions by date for proper balance tracking (stable, so same-date
+        # transactions keep their generation order) and drop unknown accounts
+        tx_df = self.transactions.to_frame().sort_values("date", kind="mergesort", ignore_index=True)
+        account_ids = tx_df["account_id"].astype(object)
+        known = account_ids.isin(account_to_user)
+        tx_df = tx_df[known].reset_index(drop=True)
+        account_ids = account_ids[known].reset_index(drop=True)
         
-        # Build transactions CSV matching transactions_final.csv format
-        transactions_final_rows = []
+        # Starting balance per account (for depository: current, for credit: -current)
+        starting_balances = accounts_df.set_index("account_id")["current"].fillna(0).astype(np.float64)
         
-        # Track running balances per account (start with initial balances)
-        account_balances = defaultdict(float)
-        for acc in self.accounts:
-            # Start with initial balance (for depository: current, for credit: -current)
-            initial_balance = acc.get("current", 0) or 0
-            if acc.get("type") == "credit":
-                # Credit cards: balance is negative (what you owe)
-                account_balances[acc["account_id"]] = initial_balance
-            else:
-                # Depository: balance is positive (what you have)
-                account_balances[acc["account_id"]] = initial_balance
+        # Running balance = starting balance + cumulative sum of amounts per account
+        # (amounts are already in correct sign: for credit cards negative amounts
+        # increase balance owed, for depository negative amounts decrease balance)
+        # (one kernel with or without Numba, so balances match bit for bit)
+        account_codes, account_uniques = pd.factorize(account_ids)
+        tx_df["account_balance"] = _running_balance_kernel(
+            account_codes,
+            tx_df["amount"].to_numpy(dtype=np.float64),
+            account_uniques.map(starting_balances).to_numpy(dtype=np.float64)
+        )
         
-        # Sort transactions by date for proper balance tracking
-        sorted_transactions = sorted(self.transactions, key=lambda x: x["date"])
+        # Generate merchant ID
+        tx_df["merchant_id"] = self._generate_merchant_ids(tx_df["merchant_name"])
         
-        for tx in sorted_transactions:
-            account = account_lookup.get(tx["account_id"])
-            if not account:
-                continue
-            
-            user_id = account["user_id"]
-            customer_id = user_id_to_customer.get(user_id, f"CUST{hash(user_id) % 1000000:06d}")
-            
-            # Parse date
-            if isinstance(tx["date"], str):
-                tx_date = datetime.fromisoformat(tx["date"].replace('Z', '+00:00'))
-            else:
-                tx_date = tx["date"]
-            
-            # Update running balance (transaction amounts are already in correct sign)
-            # For credit cards: negative amounts increase balance owed, positive decrease
-            # For depository: negative amounts decrease balance, positive increase
-            account_balances[tx["account_id"]] += tx["amount"]
-            
-            # Generate merchant ID
-            merchant_id = self._generate_merchant_id(tx.get("merchant_name", "Unknown"))
-            
-            # Map merchant category
-            merchant_category = tx.get("primary_category", "other").lower().replace(" & ", "_").replace(" ", "_")
-            
-            # Determine transaction type
-            transaction_type = self._get_transaction_type(
-                tx.get("merchant_name", ""),
-                tx.get("detailed_category", ""),
-                tx["amount"]
-            )
-            
-            # Map payment method
-            payment_method = self._map_payment_channel_to_method(
-                tx.get("payment_channel", "other"),
-                account.get("type", "depository")
-            )
-            
-            # Get amount category
-            amount_category = self._get_amount_category(tx["amount"])
-            
-            # Determine status
-            status = "pending" if tx.get("pending", False) else "approved"
-            
-            # Extract time components
-            hour = tx_date.hour
-            day_of_week = tx_date.strftime("%A")
-            month = tx_date.month
-            month_name = tx_date.strftime("%B")
-            quarter = (month - 1) // 3 + 1
-            year = tx_date.year
-            time = tx_date.strftime("%H:%M:%S")
-            timestamp = tx_date.strftime("%Y-%m-%d %H:%M:%S")
-            date = tx_date.strftime("%Y-%m-%d")
-            
-            transactions_final_rows.append({
-                "transaction_id": tx.get("transaction_id", tx["id"]),
-                "timestamp": timestamp,
-                "date": date,
-                "time": time,
-                "customer_id": customer_id,  # Dashboard identifier (user)
-                "merchant_id": merchant_id,
-                "merchant_category": merchant_category,
-                "transaction_type": transaction_type,
-                "payment_method": payment_method,
-                "amount": abs(tx["amount"]),  # transactions_final.csv shows positive amounts (sign in transaction_type)
-                "amount_category": amount_category,
-                "status": status,
-                "account_balance": account_balances[tx["account_id"]],
-                "account_id": tx["account_id"],  # Dashboard identifier (account, last 4 digits shown)
-                "hour": hour,
-                "day_of_week": day_of_week,
-                "month": month,
-                "month_name": month_name,
-                "quarter": quarter,
-                "year": year,
-            })
+        # Determine transaction type
+        tx_df["transaction_type"] = self._get_transaction_types(
+            tx_df["merchant_name"], tx_df["detailed_category"], tx_df["amount"]
+        )
+        
+        # Map payment method
+        account_types = account_ids.map(accounts_df.set_index("account_id")["type"]).fillna("depository")
+        tx_df["payment_method"] = self._map_payment_channels_to_methods(tx_df["payment_channel"], account_types)
+        
+        # Get amount category
+        tx_df["amount_category"] = self._get_amount_categories(tx_df["amount"])
+        
+        # Extract time components for the whole column at once
+        tx_dates = tx_df["date"]
+        tx_df["hour"] = tx_dates.dt.hour
+        tx_df["day_of_week"] = tx_dates.dt.day_name()
+        tx_df["month"] = tx_dates.dt.month
+        tx_df["month_name"] = tx_dates.dt.month_name()
+        tx_df["quarter"] = tx_dates.dt.quarter
+        tx_df["year"] = tx_dates.dt.year
+        tx_df["time"] = tx_dates.dt.strftime("%H:%M:%S")
+        tx_df["timestamp"] = tx_dates.dt.strftime("%Y-%m-%d %H:%M:%S")
+        tx_df["date"] = tx_dates.dt.strftime("%Y-%m-%d")
+        
+        # Map merchant category (normalized once per distinct category, not per row)
+        merchant_categories = tx_df["primary_category"].astype("category").map(_export_category)
+        
+        # Build transactions CSV matching transactions_final.csv format, column by column
+        # (copy=False: the export frame shares tx_df's column buffers instead of duplicating them)
+        transactions_final_df = pd.DataFrame({
+            "transaction_id": tx_df["transaction_id"],
+            "timestamp": tx_df["timestamp"],
+            "date": tx_df["date"],
+            "time": tx_df["time"],
+            "customer_id": account_ids.map(account_to_user).map(user_id_to_customer),  # Dashboard identifier (user)
+            "merchant_id": tx_df["merchant_id"],
+            "merchant_category": merchant_categories,
+            "transaction_type": tx_df["transaction_type"],
+            "payment_method": tx_df["payment_method"],
+            "amount": tx_df["amount"].abs(),  # transactions_final.csv shows positive amounts (sign in transaction_type)
+            "amount_category": tx_df["amount_category"],
+            "status": np.where(tx_df["pending"], "pending", "approved"),
+            "account_balance": tx_df["account_balance"],
+            "account_id": tx_df["account_id"],  # Dashboard identifier (account, last 4 digits shown)
+            "hour": tx_df["hour"],
+            "day_of_week": tx_df["day_of_week"],
+            "month": tx_df["month"],
+            "month_name": tx_df["month_name"],
+            "quarter": tx_df["quarter"],
+            "year": tx_df["year"],
+        }, copy=False)
+        
+        # Fixed dtypes for the writer: low-cardinality strings as categoricals,
+        # small integers as int16
+        for name in self.EXPORT_CATEGORICAL_COLUMNS:
+            transactions_final_df[name] = transactions_final_df[name].astype("category")
+        for name in ("hour", "month", "quarter", "year"):
+            transactions_final_df[name] = transactions_final_df[name].astype(np.int16)
         
         # Save transactions in transactions_final.csv format
-        transactions_df = pd.DataFrame(transactions_final_rows)
-        transactions_df.to_csv(f"{output_dir}/transactions_final.csv", index=False)
+        _write_csv(transactions_final_df, f"{output_dir}/transactions_final.csv")
         
         # Also save in original format for compatibility
-        pd.DataFrame(self.transactions).to_csv(f"{output_dir}/transactions.csv", index=False)
+        _write_csv(self.transactions.to_frame(), f"{output_dir}/transactions.csv")
         
         print(f"Generated data saved to {output_dir}/")
         print(f"  - {len(self.users)} users")
         print(f"  - {len(self.accounts)} accounts")
         print(f"  - {len(self.transactions)} transactions")
         print(f"  - {len(self.liabilities)} liabilities")
-        print(f"  - transactions_final.csv created with {len(transactions_final_rows)} rows")
+        print(f"  - transactions_final.csv created with {len(transactions_final_df)} rows")
+
+
+def _generate_user_batch(
+    user_specs: List[Tuple[str, str, bool]],
+    start_date: datetime,
+    end_date: datetime,
+    seed: int
+) -> Dict[str, Any]:
+    """Generate a batch of users in a worker process (see generate_all).
+    
+    Args:
+        user_specs: (persona, financial_profile, low_risk_two_accounts) per user
+        start_date: Start of the transaction window
+        end_date: End of the transaction window
+        seed: Seed for this batch's RNGs
+    
+    Returns:
+        Dictionary of users, accounts and liabilities lists plus the
+        transaction column lists
+    """
+    generator = SyntheticDataGenerator(num_users=len(user_specs), seed=seed)
+    for persona, profile, low_risk_two_accounts in user_specs:
+        generator._generate_single_user(persona, profile, low_risk_two_accounts, start_date, end_date)
+    return {
+        "users": generator.users,
+        "accounts": generator.accounts,
+        "transactions": generator.transactions.columns,
+        "liabilities": generator.liabilities
+    }
 
 
 if __name__ == "__main__":
@@ -1620,10 +2076,11 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate synthetic Plaid-style data")
     parser.add_argument("--num-users", type=int, default=75, help="Number of users to generate (50-100)")
     parser.add_argument("--output-dir", type=str, default="data/synthetic", help="Output directory")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for user generation (default 1)")
     
     args = parser.parse_args()
     
-    generator = SyntheticDataGenerator(num_users=args.num_users)
+    generator = SyntheticDataGenerator(num_users=args.num_users, workers=args.workers)
     generator.generate_all()
     generator.save_to_csv(args.output_dir)
 
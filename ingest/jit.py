@@ -0,0 +1,18 @@
+"""Optional Numba JIT compilation for numeric kernels.
+
+Numba is not a required dependency (install it with ``pip install numba``).
+Without it, ``njit`` is a no-op decorator and kernels run as plain Python
+with identical results, only slower.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        def decorator(func):
+            return func
+        return decorator
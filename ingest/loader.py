@@ -1,54 +1,281 @@
 """Data loader for ingesting CSV/JSON data into SQLite database."""
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from ingest.schema import (
     User, Account, Transaction, Liability, Consent,
-    init_db, get_session
+    get_session
 )
 
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Column types for each CSV file, mirroring the database columns. IDs are read
+# as strings so numeric-looking account IDs keep their exact text; datetime
+# columns stay as text here and are parsed by _coerce_columns.
+CSV_DTYPES = {
+    "users": {
+        "id": "string", "name": "string", "email": "string", "created_at": "string"
+    },
+    "accounts": {
+        "id": "string", "user_id": "string", "account_id": "string", "name": "string",
+        "type": "string", "subtype": "string", "iso_currency_code": "string",
+        "available": "float64", "current": "float64", "limit": "float64",
+        "holder_category": "string", "amount_due": "float64", "minimum_payment_due": "float64",
+        "interest_rate": "float64", "next_payment_due_date": "string", "created_at": "string"
+    },
+    "transactions": {
+        "id": "string", "account_id": "string", "transaction_id": "string", "date": "string",
+        "amount": "float64", "merchant_name": "string", "merchant_entity_id": "string",
+        "payment_channel": "string", "primary_category": "string",
+        "detailed_category": "string", "pending": "boolean", "created_at": "string"
+    },
+    "liabilities": {
+        "id": "string", "account_id": "string", "apr_type": "string", "apr_percentage": "float64",
+        "minimum_payment_amount": "float64", "last_payment_amount": "float64",
+        "last_payment_date": "string", "is_overdue": "boolean", "next_payment_due_date": "string",
+        "last_statement_balance": "float64", "liability_type": "string",
+        "interest_rate": "float64", "created_at": "string"
+    }
+}
+
+
+# Rows per chunk when streaming transactions.csv into the database
+TRANSACTIONS_CHUNK_SIZE = 50_000
+
+# How SQLAlchemy's SQLite DateTime type stores values, for raw DBAPI inserts
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# Transactions are inserted through the DBAPI cursor directly (see load_transactions)
+TRANSACTION_INSERT_COLUMNS = (
+    "id", "account_id", "transaction_id", "date", "amount", "merchant_name",
+    "merchant_entity_id", "payment_channel", "primary_category", "detailed_category",
+    "pending", "created_at"
+)
+TRANSACTION_INSERT_SQL = (
+    f"INSERT INTO transactions ({', '.join(TRANSACTION_INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(TRANSACTION_INSERT_COLUMNS))}) ON CONFLICT DO NOTHING"
+)
+
+
+def _read_csv(path: str, table: str, chunksize: Optional[int] = None):
+    """Read one of the loader's CSV files with its declared column types.
+    
+    Uses the pyarrow parser when pyarrow is installed and the C parser otherwise.
+    The pyarrow parser cannot stream, so chunked reads always use the C parser.
+    
+    Args:
+        path: Path to the CSV file
+        table: Key into CSV_DTYPES ("users", "accounts", "transactions" or "liabilities")
+        chunksize: If set, return an iterator of DataFrames with this many rows each
+    
+    Returns:
+        Parsed DataFrame, or an iterator of DataFrames if chunksize is set
+    """
+    engine = "pyarrow" if PYARROW_AVAILABLE and chunksize is None else "c"
+    return pd.read_csv(path, engine=engine, dtype=CSV_DTYPES[table], chunksize=chunksize)
+
+
+def _raise_on_unparsed(df: pd.DataFrame, column: str, parsed: pd.Series):
+    """Raise if any non-blank value in a column failed to parse.
+    
+    Args:
+        df: Frame holding the original column values
+        column: Name of the column that was parsed
+        parsed: Parsed values (missing where parsing failed)
+    
+    Raises:
+        ValueError: Naming the offending rows by id with their original values
+    """
+    original = df[column]
+    failed = parsed.isna() & original.notna() & (original.astype(str).str.strip() != "")
+    if failed.any():
+        ids = df["id"] if "id" in df else df.index.to_series(index=df.index)
+        examples = ", ".join(
+            f"{row_id}: {value!r}" for row_id, value in zip(ids[failed][:5], original[failed][:5])
+        )
+        raise ValueError(f"Could not parse {int(failed.sum())} {column} value(s) (id: value): {examples}")
+
+
+def _coerce_columns(
+    df: pd.DataFrame,
+    defaults: Optional[Dict[str, Any]] = None,
+    float_columns: Tuple[str, ...] = (),
+    datetime_columns: Tuple[str, ...] = (),
+    bool_columns: Tuple[str, ...] = (),
+    datetime_format: Optional[str] = None,
+    required_columns: Tuple[str, ...] = ()
+) -> pd.DataFrame:
+    """Convert a frame's columns to their database types in one pass per column.
+    
+    Numeric and datetime columns are parsed as whole columns (blank values
+    become missing; any other value that does not parse raises), bool columns
+    treat missing values as False, and every missing value ends up as None so
+    rows can be inserted as-is.
+    Optional columns missing from the frame are added with their default value,
+    so the row loops can read every column as a plain attribute; datetime
+    columns with a default also use it in place of blank values.
+    
+    Args:
+        df: Frame to convert (not modified)
+        defaults: Value to fill for each optional column the frame does not have
+        float_columns: Columns to convert to floats
+        datetime_columns: Columns to convert to datetimes
+        bool_columns: Columns to convert to bools
+        datetime_format: If set, render datetime columns as strings in this format
+            (for inserts that bypass SQLAlchemy's DateTime type)
+        required_columns: Columns that must have a value in every row (NOT NULL in the database)
+    
+    Returns:
+        Converted frame with object columns and None for missing values
+    
+    Raises:
+        ValueError: If a non-blank numeric or datetime value cannot be parsed, or a
+            required column is missing a value
+    """
+    df = df.copy()
+    for column, default in (defaults or {}).items():
+        if column not in df:
+            df[column] = default
+    for column in float_columns:
+        if column in df:
+            parsed = pd.to_numeric(df[column], errors="coerce")
+            _raise_on_unparsed(df, column, parsed)
+            df[column] = parsed
+    for column in datetime_columns:
+        if column in df:
+            parsed = pd.to_datetime(df[column], errors="coerce", format="ISO8601")
+            # Fall back to per-value format inference for anything that is not ISO 8601
+            failed = parsed.isna() & df[column].notna()
+            if failed.any():
+                parsed[failed] = pd.to_datetime(df[column][failed], errors="coerce", format="mixed")
+            _raise_on_unparsed(df, column, parsed)
+            df[column] = parsed
+            if defaults and defaults.get(column) is not None:
+                df[column] = df[column].fillna(defaults[column])
+            if datetime_format is not None:
+                df[column] = df[column].dt.strftime(datetime_format)
+    for column in bool_columns:
+        if column in df:
+            df[column] = df[column].fillna(False).astype(bool)
+    for column in required_columns:
+        missing = df[column].isna()
+        if missing.any():
+            ids = df["id"] if "id" in df else df.index.to_series(index=df.index)
+            raise ValueError(
+                f"Missing {column} for {int(missing.sum())} row(s), ids: {', '.join(map(str, ids[missing][:5]))}"
+            )
+    return df.astype(object).where(df.notna(), None)
+
+
+@contextmanager
+def _prefetch(iterator, executor: ThreadPoolExecutor):
+    """Iterate an iterator's items while the following item is produced on the executor.
+    
+    On exit, any read-ahead still in flight is cancelled or waited for, so the
+    underlying iterator can be closed safely even if iteration stopped early.
+    
+    Args:
+        iterator: Iterator to read ahead from (only one next() call runs at a time)
+        executor: Executor that runs the read-ahead
+    
+    Yields:
+        Iterator over the items, in order
+    """
+    done = object()
+    pending = [executor.submit(next, iterator, done)]
+    
+    def items():
+        while True:
+            item = pending[0].result()
+            if item is done:
+                return
+            pending[0] = executor.submit(next, iterator, done)
+            yield item
+    
+    try:
+        yield items()
+    finally:
+        if not pending[0].cancel():
+            # Read-ahead already running: let it finish before the iterator is closed
+            wait(pending)
+
 
 class DataLoader:
     """Load data from CSV/JSON files into database."""
     
-    def __init__(self, db_path: str = "data/spendsense.db"):
+    def __init__(self, db_path: str = "data/spendsense.db", fast_ingest: bool = False):
         """Initialize loader.
         
         Args:
             db_path: Path to SQLite database
+            fast_ingest: If True, load with synchronous=OFF (faster, but a power
+                loss mid-load can corrupt the database)
         """
         self.db_path = db_path
-        init_db(db_path)
-        self.session = get_session(db_path)
+        # Rows go in through Core inserts, so there is never pending ORM state to
+        # autoflush before the dedup queries or loaded instances to expire on commit
+        self.session = get_session(
+            db_path, fast_ingest=fast_ingest, autoflush=False, expire_on_commit=False
+        )
     
-    def load_users(self, users_df: pd.DataFrame):
-        """Load users from DataFrame."""
-        loaded_count = 0
-        skipped_count = 0
-        for _, row in users_df.iterrows():
-            # Check if user already exists (by email or id)
-            existing_user = self.session.query(User).filter(
-                (User.email == row["email"]) | (User.id == row["id"])
-            ).first()
-            
-            if existing_user:
-                skipped_count += 1
-                continue
-            
-            user = User(
-                id=row["id"],
-                name=row["name"],
-                email=row["email"],
-                created_at=pd.to_datetime(row.get("created_at", datetime.now()))
-            )
-            self.session.add(user)
-            loaded_count += 1
+    def _bulk_insert(self, model, rows: List[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """Insert rows into a model's table, skipping rows that already exist.
+        
+        Uses Core executemany INSERTs (no per-row ORM instances or identity map)
+        with ON CONFLICT DO NOTHING, so rows that collide with a stored primary
+        key or unique column (or an earlier row in the same load) are skipped by
+        SQLite itself. Rows are sent in chunks of chunk_size to bound statement size.
+        
+        Args:
+            model: ORM model class whose table receives the rows
+            rows: Column values per row (same keys in every row)
+            chunk_size: Rows per INSERT batch
         
-        self.session.commit()
+        Returns:
+            Number of rows actually inserted
+        """
+        stmt = sqlite_insert(model.__table__).on_conflict_do_nothing()
+        inserted = 0
+        for start in range(0, len(rows), chunk_size):
+            inserted += self.session.execute(stmt, rows[start:start + chunk_size]).rowcount
+        return inserted
+    
+    def load_users(self, users_df: pd.DataFrame, commit: bool = True):
+        """Load users from DataFrame.
+        
+        Args:
+            users_df: Users to load
+            commit: If False, leave the inserts in the open transaction for the caller to commit
+        """
+        users_df = _coerce_columns(
+            users_df, defaults={"created_at": datetime.now()}, datetime_columns=("created_at",)
+        )
+        
+        user_rows = []
+        for row in users_df.itertuples(index=False):
+            user_rows.append(dict(
+                id=row.id,
+                name=row.name,
+                email=row.email,
+                created_at=row.created_at
+            ))
+        
+        # Users already stored (by id or email) are skipped by the insert
+        loaded_count = self._bulk_insert(User, user_rows)
+        skipped_count = len(user_rows) - loaded_count
+        if commit:
+            self.session.commit()
         print(f"Loaded {loaded_count} new users, skipped {skipped_count} existing users")
     
     def load_from_csv(self, data_dir: str, clear_existing: bool = False):
@@ -60,172 +287,221 @@ class DataLoader:
         """
         import os
         
-        if clear_existing:
-            print("Clearing existing data...")
-            from ingest.schema import User, Account, Transaction, Liability
-            self.session.query(Transaction).delete()
-            self.session.query(Liability).delete()
-            self.session.query(Account).delete()
-            self.session.query(User).delete()
-            self.session.commit()
-            print("Existing data cleared.")
-        
         users_path = os.path.join(data_dir, "users.csv")
         accounts_path = os.path.join(data_dir, "accounts.csv")
         transactions_path = os.path.join(data_dir, "transactions.csv")
         liabilities_path = os.path.join(data_dir, "liabilities.csv")
         
-        # Load in order: users -> accounts -> transactions -> liabilities
-        if os.path.exists(users_path):
-            users_df = pd.read_csv(users_path)
-            self.load_users(users_df)
+        # Parse the three small files in the background while earlier tables load;
+        # transactions are streamed with the next chunk parsed during each insert
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            users_future = executor.submit(_read_csv, users_path, "users") if os.path.exists(users_path) else None
+            accounts_future = executor.submit(_read_csv, accounts_path, "accounts") if os.path.exists(accounts_path) else None
+            liabilities_future = (
+                executor.submit(_read_csv, liabilities_path, "liabilities") if os.path.exists(liabilities_path) else None
+            )
+            
+            # Clear and load everything in one transaction so the database is
+            # synced once and a failed load leaves the previous data intact
+            try:
+                if clear_existing:
+                    print("Clearing existing data...")
+                    from ingest.schema import User, Account, Transaction, Liability
+                    self.session.query(Transaction).delete()
+                    self.session.query(Liability).delete()
+                    self.session.query(Account).delete()
+                    self.session.query(User).delete()
+                    print("Existing data cleared.")
+                
+                # Load in order: users -> accounts -> transactions -> liabilities
+                if users_future is not None:
+                    self.load_users(users_future.result(), commit=False)
+                
+                if accounts_future is not None:
+                    self.load_accounts(accounts_future.result(), commit=False)
+                
+                # Stream transactions so memory stays bounded for large files
+                if os.path.exists(transactions_path):
+                    with _read_csv(transactions_path, "transactions", chunksize=TRANSACTIONS_CHUNK_SIZE) as reader, \
+                            _prefetch(reader, executor) as chunks:
+                        for transactions_df in chunks:
+                            self.load_transactions(transactions_df, commit=False)
+                
+                if liabilities_future is not None:
+                    self.load_liabilities(liabilities_future.result(), commit=False)
+                
+                self.session.commit()
+            except Exception:
+                self.session.rollback()
+                raise
+    
+    def load_accounts(self, accounts_df: pd.DataFrame, commit: bool = True):
+        """Load accounts from DataFrame.
         
-        if os.path.exists(accounts_path):
-            accounts_df = pd.read_csv(accounts_path)
-            self.load_accounts(accounts_df)
+        Args:
+            accounts_df: Accounts to load
+            commit: If False, leave the inserts in the open transaction for the caller to commit
+        """
+        accounts_df = _coerce_columns(
+            accounts_df,
+            defaults={
+                "created_at": datetime.now(), "subtype": None, "iso_currency_code": "USD",
+                "available": None, "current": None, "limit": None, "amount_due": None,
+                "minimum_payment_due": None, "interest_rate": None, "next_payment_due_date": None,
+                "holder_category": "individual"
+            },
+            float_columns=(
+                "available", "current", "limit", "amount_due", "minimum_payment_due", "interest_rate"
+            ),
+            datetime_columns=("next_payment_due_date", "created_at")
+        )
         
-        if os.path.exists(transactions_path):
-            transactions_df = pd.read_csv(transactions_path)
-            self.load_transactions(transactions_df)
+        account_rows = []
+        for row in accounts_df.itertuples(index=False):
+            account_rows.append(dict(
+                id=row.id,
+                user_id=row.user_id,
+                account_id=row.account_id,
+                name=row.name,
+                type=row.type,
+                subtype=row.subtype,
+                iso_currency_code=row.iso_currency_code,
+                available=row.available,
+                current=row.current,
+                limit=row.limit,
+                amount_due=row.amount_due,  # Credit card field
+                minimum_payment_due=row.minimum_payment_due,  # Credit card field
+                interest_rate=row.interest_rate,  # Loan-specific field
+                next_payment_due_date=row.next_payment_due_date,  # Loan-specific field
+                holder_category=row.holder_category,
+                created_at=row.created_at
+            ))
         
-        if os.path.exists(liabilities_path):
-            liabilities_df = pd.read_csv(liabilities_path)
-            self.load_liabilities(liabilities_df)
-    
-    def load_accounts(self, accounts_df: pd.DataFrame):
-        """Load accounts from DataFrame."""
-        loaded_count = 0
-        skipped_count = 0
-        for _, row in accounts_df.iterrows():
-            # Check if account already exists
-            existing_account = self.session.query(Account).filter(
-                (Account.id == row["id"]) | (Account.account_id == row["account_id"])
-            ).first()
-            
-            if existing_account:
-                skipped_count += 1
-                continue
-            
-            # Helper to handle None/NaN values
-            def safe_get(key, default=None):
-                val = row.get(key, default)
-                return None if pd.isna(val) or val == '' else val
-            
-            def safe_float(key):
-                val = safe_get(key)
-                return float(val) if val is not None else None
-            
-            account = Account(
-                    id=row["id"],
-                    user_id=row["user_id"],
-                    account_id=row["account_id"],
-                    name=row["name"],
-                    type=row["type"],
-                    subtype=row.get("subtype"),
-                    iso_currency_code=row.get("iso_currency_code", "USD"),
-                    available=safe_float("available"),
-                    current=safe_float("current"),
-                    limit=safe_float("limit"),
-                    amount_due=safe_float("amount_due"),  # Credit card field
-                    minimum_payment_due=safe_float("minimum_payment_due"),  # Credit card field
-                    interest_rate=safe_float("interest_rate"),  # Loan-specific field
-                    next_payment_due_date=pd.to_datetime(row["next_payment_due_date"]) if pd.notna(row.get("next_payment_due_date")) else None,  # Loan-specific field
-                    holder_category=row.get("holder_category", "individual"),
-                    created_at=pd.to_datetime(row.get("created_at", datetime.now()))
-                )
-            self.session.add(account)
-            loaded_count += 1
-        
-        self.session.commit()
+        # Accounts already stored (by id or account_id) are skipped by the insert
+        loaded_count = self._bulk_insert(Account, account_rows)
+        skipped_count = len(account_rows) - loaded_count
+        if commit:
+            self.session.commit()
         print(f"Loaded {loaded_count} new accounts, skipped {skipped_count} existing accounts")
     
-    def load_transactions(self, transactions_df: pd.DataFrame):
-        """Load transactions from DataFrame."""
-        loaded_count = 0
+    def load_transactions(self, transactions_df: pd.DataFrame, commit: bool = True):
+        """Load transactions from DataFrame.
+        
+        Args:
+            transactions_df: Transactions to load
+            commit: If False, leave the inserts in the open transaction for the caller to commit
+        """
         skipped_count = 0
-        for _, row in transactions_df.iterrows():
-            # Check if transaction already exists
-            existing_transaction = self.session.query(Transaction).filter(
-                (Transaction.id == row["id"]) | (Transaction.transaction_id == row["transaction_id"])
-            ).first()
-            
-            if existing_transaction:
-                skipped_count += 1
-                continue
-            
-            # Get account_id from account_id column (which should map to Account.account_id)
-            account_id = row["account_id"]
-            
-            # Find the Account record by account_id
-            account = self.session.query(Account).filter(
-                Account.account_id == account_id
-            ).first()
-            
-            if not account:
-                print(f"Warning: Account {account_id} not found for transaction {row['transaction_id']}")
+        
+        # Fetch the account_id -> internal ID map once instead of querying per row
+        account_map = dict(self.session.query(Account.account_id, Account.id))
+        
+        # Resolve each row's Account internal ID (the FK) for the whole frame at once
+        transactions_df = transactions_df.assign(
+            account_internal_id=transactions_df["account_id"].astype(str).map(account_map)
+        )
+        transactions_df = _coerce_columns(
+            transactions_df,
+            defaults={
+                "created_at": datetime.now(), "merchant_name": None, "merchant_entity_id": None,
+                "payment_channel": None, "primary_category": None, "detailed_category": None,
+                "pending": False
+            },
+            float_columns=("amount",),
+            datetime_columns=("date", "created_at"),
+            bool_columns=("pending",),
+            datetime_format=SQLITE_DATETIME_FORMAT,
+            required_columns=("date", "amount")
+        )
+        
+        transaction_rows = []
+        for row in transactions_df.itertuples(index=False):
+            account_internal_id = row.account_internal_id
+            if account_internal_id is None:
+                print(f"Warning: Account {row.account_id} not found for transaction {row.transaction_id}")
                 skipped_count += 1
                 continue
             
-            transaction = Transaction(
-                id=row["id"],
-                account_id=account.id,  # Use internal ID, not account_id
-                transaction_id=row["transaction_id"],
-                date=pd.to_datetime(row["date"]),
-                amount=float(row["amount"]),
-                merchant_name=row.get("merchant_name"),
-                merchant_entity_id=row.get("merchant_entity_id"),
-                payment_channel=row.get("payment_channel"),
-                primary_category=row.get("primary_category"),
-                detailed_category=row.get("detailed_category"),
-                pending=bool(row.get("pending", False)),
-                created_at=pd.to_datetime(row.get("created_at", datetime.now()))
-            )
-            self.session.add(transaction)
-            loaded_count += 1
+            # Values in TRANSACTION_INSERT_COLUMNS order; account_id is the internal ID
+            transaction_rows.append((
+                row.id, account_internal_id, row.transaction_id, row.date, row.amount,
+                row.merchant_name, row.merchant_entity_id, row.payment_channel,
+                row.primary_category, row.detailed_category, row.pending, row.created_at
+            ))
+        
+        # The highest-volume table goes straight to the sqlite3 cursor: executemany
+        # on plain tuples, skipping SQLAlchemy's per-row parameter processing. It runs
+        # on the session's connection, so it shares the session's transaction.
+        # Transactions already stored (by id or transaction_id) are skipped.
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.executemany(TRANSACTION_INSERT_SQL, transaction_rows)
+            loaded_count = max(cursor.rowcount, 0)
+        finally:
+            cursor.close()
+        skipped_count += len(transaction_rows) - loaded_count
         
-        self.session.commit()
+        if commit:
+            self.session.commit()
         print(f"Loaded {loaded_count} new transactions, skipped {skipped_count} existing transactions")
     
-    def load_liabilities(self, liabilities_df: pd.DataFrame):
-        """Load liabilities from DataFrame."""
-        for _, row in liabilities_df.iterrows():
-            # Find account by account_id
-            account = self.session.query(Account).filter(
-                Account.account_id == row["account_id"]
-            ).first()
-            
-            if not account:
-                print(f"Warning: Account {row['account_id']} not found for liability")
+    def load_liabilities(self, liabilities_df: pd.DataFrame, commit: bool = True):
+        """Load liabilities from DataFrame.
+        
+        Args:
+            liabilities_df: Liabilities to load
+            commit: If False, leave the inserts in the open transaction for the caller to commit
+        """
+        # Resolve each row's Account internal ID from one account_id -> internal ID map
+        account_map = dict(self.session.query(Account.account_id, Account.id))
+        
+        liabilities_df = _coerce_columns(
+            liabilities_df.assign(
+                account_internal_id=liabilities_df["account_id"].astype(str).map(account_map)
+            ),
+            defaults={
+                "created_at": datetime.now(), "apr_type": None, "apr_percentage": None,
+                "minimum_payment_amount": None, "last_payment_amount": None,
+                "last_payment_date": None, "is_overdue": False, "next_payment_due_date": None,
+                "last_statement_balance": None, "interest_rate": None, "liability_type": None
+            },
+            float_columns=(
+                "apr_percentage", "minimum_payment_amount", "last_payment_amount",
+                "last_statement_balance", "interest_rate"
+            ),
+            datetime_columns=("last_payment_date", "next_payment_due_date", "created_at"),
+            bool_columns=("is_overdue",)
+        )
+        liabilities_df["apr_type"] = liabilities_df["apr_type"].mask(liabilities_df["apr_type"] == "")
+        
+        liability_rows = []
+        for row in liabilities_df.itertuples(index=False):
+            account_internal_id = row.account_internal_id
+            if account_internal_id is None:
+                print(f"Warning: Account {row.account_id} not found for liability")
                 continue
             
-            # Helper to handle None/NaN values
-            def safe_get(key, default=None):
-                val = row.get(key, default)
-                return None if pd.isna(val) or val == '' else val
-            
-            def safe_float(key):
-                val = safe_get(key)
-                return float(val) if val is not None else None
-            
-            liability = Liability(
-                id=row["id"],
-                account_id=account.id,
-                apr_type=safe_get("apr_type"),
-                apr_percentage=safe_float("apr_percentage"),
-                minimum_payment_amount=safe_float("minimum_payment_amount"),
-                last_payment_amount=safe_float("last_payment_amount"),
-                last_payment_date=pd.to_datetime(row["last_payment_date"]) if pd.notna(row.get("last_payment_date")) else None,
-                is_overdue=bool(row.get("is_overdue", False)) if pd.notna(row.get("is_overdue")) else False,
-                next_payment_due_date=pd.to_datetime(row["next_payment_due_date"]) if pd.notna(row.get("next_payment_due_date")) else None,
-                last_statement_balance=safe_float("last_statement_balance"),
-                interest_rate=safe_float("interest_rate"),
-                liability_type=row.get("liability_type"),
-                created_at=pd.to_datetime(row.get("created_at", datetime.now()))
-            )
-            self.session.add(liability)
+            liability_rows.append(dict(
+                id=row.id,
+                account_id=account_internal_id,
+                apr_type=row.apr_type,
+                apr_percentage=row.apr_percentage,
+                minimum_payment_amount=row.minimum_payment_amount,
+                last_payment_amount=row.last_payment_amount,
+                last_payment_date=row.last_payment_date,
+                is_overdue=row.is_overdue,
+                next_payment_due_date=row.next_payment_due_date,
+                last_statement_balance=row.last_statement_balance,
+                interest_rate=row.interest_rate,
+                liability_type=row.liability_type,
+                created_at=row.created_at
+            ))
         
-        self.session.commit()
-        print(f"Loaded {len(liabilities_df)} liabilities")
+        # Liabilities already stored are skipped by the insert, so reloads succeed
+        loaded_count = self._bulk_insert(Liability, liability_rows)
+        if commit:
+            self.session.commit()
+        print(f"Loaded {loaded_count} liabilities")
     
     def close(self):
         """Close database session."""
@@ -1,13 +1,15 @@
 """Database schema definitions for SpendSense."""
 
+import os
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from sqlalchemy import (
     Column, String, Integer, Float, Boolean, DateTime, 
-    ForeignKey, Text, JSON, create_engine
+    ForeignKey, Text, JSON, Index, create_engine, event
 )
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm import object_session, relationship, sessionmaker
 from sqlalchemy.sql import func
 
 Base = declarative_base()
@@ -50,7 +52,19 @@ class User(Base):
         """
         loans = {'mortgage': None, 'student_loan': None}
         
-        for account in self.accounts:
+        # Reuse accounts already loaded on the user; otherwise fetch only the
+        # loan accounts instead of lazy-loading every account the user has
+        session = object_session(self)
+        if "accounts" in self.__dict__ or session is None:
+            accounts = self.accounts
+        else:
+            accounts = session.query(Account).filter(
+                Account.user_id == self.id,
+                Account.type == "loan",
+                Account.subtype.in_(["mortgage", "student_loan"])
+            ).all()
+        
+        for account in accounts:
             if account.type == "loan":
                 if account.subtype == "mortgage":
                     loans['mortgage'] = {
@@ -108,6 +122,11 @@ class Account(Base):
     transactions = relationship("Transaction", back_populates="account", cascade="all, delete-orphan")
     liabilities = relationship("Liability", back_populates="account", cascade="all, delete-orphan")
     
+    # Covers account_id -> id lookups (loader FK resolution) without touching the table
+    __table_args__ = (
+        Index("ix_accounts_account_id_id", "account_id", "id"),
+    )
+    
     def get_loan_info(self):
         """Get loan-specific information if this is a loan account.
         
@@ -157,6 +176,11 @@ class Transaction(Base):
     # Relationships
     account = relationship("Account", back_populates="transactions")
     
+    # Transactions are read per account and date range; the FK has no index otherwise
+    __table_args__ = (
+        Index("ix_transactions_account_id_date", "account_id", "date"),
+    )
+    
     def __repr__(self):
         return f"<Transaction(id={self.transaction_id}, amount={self.amount}, date={self.date})>"
 
@@ -342,47 +366,123 @@ class ApprovedActionPlan(Base):
 
 
 # Database setup
-def get_engine(db_path: str = "data/spendsense.db"):
-    """Get SQLAlchemy engine."""
-    # Add timeout settings for SQLite to prevent hangs
-    # timeout=20: Wait up to 20 seconds for database lock
-    # check_same_thread=False: Allow connections from different threads
-    return create_engine(
-        f"sqlite:///{db_path}",
-        echo=False,
-        connect_args={
-            "timeout": 20,  # Wait up to 20 seconds for database lock
-            "check_same_thread": False  # Allow connections from different threads
-        }
-    )
+def _set_bulk_load_pragmas(dbapi_connection, connection_record):
+    """Connect-event hook applying SQLite PRAGMAs for bulk-loading engines.
+    
+    synchronous=OFF skips fsyncs entirely (a power loss mid-load can corrupt
+    the database), and the large page cache, in-memory temp storage and mmap
+    I/O trade memory for write throughput. These settings are per connection
+    and leave the journal mode alone, so nothing persists in the database file.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA cache_size=-262144")  # 256 MB page cache
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped I/O
+    cursor.close()
+
+
+# Engines (with their session factories) are cached per database path and
+# fast_ingest flag, so repeated get_session calls reuse one connection pool
+# instead of building a new engine and re-inspecting the schema each time
+_engine_cache: Dict[Tuple[str, bool], Tuple[Engine, sessionmaker]] = {}
+_initialized_paths = set()
+
+
+def get_engine(db_path: str = "data/spendsense.db", fast_ingest: bool = False) -> Engine:
+    """Get SQLAlchemy engine.
+    
+    Engines are created once per (db_path, fast_ingest) and reused.
+    
+    Args:
+        db_path: Path to SQLite database
+        fast_ingest: If True, connections use bulk-loading PRAGMAs (see _set_bulk_load_pragmas)
+    """
+    return _get_cached_engine(db_path, fast_ingest)[0]
 
 
-def get_session(db_path: str = "data/spendsense.db"):
-    """Get database session."""
+def _get_cached_engine(db_path: str, fast_ingest: bool) -> Tuple[Engine, sessionmaker]:
+    """Return the cached (engine, session factory) pair for a database, creating it if needed."""
+    key = (db_path, fast_ingest)
+    cached = _engine_cache.get(key)
+    if cached is None:
+        # Add timeout settings for SQLite to prevent hangs
+        # timeout=20: Wait up to 20 seconds for database lock
+        # check_same_thread=False: Allow connections from different threads
+        engine = create_engine(
+            f"sqlite:///{db_path}",
+            echo=False,
+            connect_args={
+                "timeout": 20,  # Wait up to 20 seconds for database lock
+                "check_same_thread": False  # Allow connections from different threads
+            }
+        )
+        # Only bulk-loading engines get the tuned PRAGMAs; the long-lived app
+        # engine keeps SQLite's defaults (rollback journal, modest page cache)
+        if fast_ingest:
+            event.listen(engine, "connect", _set_bulk_load_pragmas)
+        cached = _engine_cache[key] = (engine, sessionmaker(bind=engine))
+    return cached
+
+
+def dispose_engine(db_path: str):
+    """Close and forget the cached engines for a database.
+    
+    Call this before replacing or deleting the database file so later
+    sessions open fresh connections (and re-check the schema).
+    
+    Args:
+        db_path: Path to SQLite database
+    """
+    for fast_ingest in (False, True):
+        cached = _engine_cache.pop((db_path, fast_ingest), None)
+        if cached is not None:
+            cached[0].dispose()
+    _initialized_paths.discard(db_path)
+
+
+def _create_schema(engine: Engine):
+    """Create missing tables, and missing indexes on tables that already exist.
+    
+    create_all only creates indexes together with new tables, so indexes added
+    to the models later are created here for databases built before them.
+    """
+    Base.metadata.create_all(engine)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
+def _ensure_schema(db_path: str, engine: Engine):
+    """Create any missing tables the first time a database path is used."""
+    if db_path in _initialized_paths and os.path.exists(db_path):
+        return
+    _create_schema(engine)
+    _initialized_paths.add(db_path)
+
+
+def get_session(db_path: str = "data/spendsense.db", fast_ingest: bool = False, **session_options):
+    """Get database session.
+    
+    Args:
+        db_path: Path to SQLite database
+        fast_ingest: If True, use a bulk-loading engine (see get_engine)
+        **session_options: Session settings overriding the defaults (e.g. autoflush=False)
+    """
     # Ensure database schema is initialized
     # This is important for Railway where containers are ephemeral
-    try:
-        engine = get_engine(db_path)
-        # Check if tables exist by trying to query a table
-        from sqlalchemy import inspect
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
-        if not tables:
-            # No tables found, initialize schema
-            init_db(db_path)
-            engine = get_engine(db_path)  # Recreate engine after init
-    except Exception:
-        # If check fails, try to initialize anyway
-        init_db(db_path)
-        engine = get_engine(db_path)
-    
-    Session = sessionmaker(bind=engine)
-    return Session()
+    if not os.path.exists(db_path):
+        dispose_engine(db_path)
+    engine, Session = _get_cached_engine(db_path, fast_ingest)
+    _ensure_schema(db_path, engine)
+    return Session(**session_options)
 
 
 def init_db(db_path: str = "data/spendsense.db"):
     """Initialize database with schema."""
+    if not os.path.exists(db_path):
+        dispose_engine(db_path)
     engine = get_engine(db_path)
-    Base.metadata.create_all(engine)
+    _create_schema(engine)
+    _initialized_paths.add(db_path)
     return engine
-
@@ -379,7 +379,7 @@ class RecommendationGenerator:
                 expected_impact = rec_template.expected_impact
             
             # Validate tone
-            is_valid, tone_issues = self.tone_validator.check_rationale(personalized_text)
+            is_valid, _ = self.tone_validator.check_rationale(personalized_text, detail=False)
             if not is_valid:
                 personalized_text = self.tone_validator.sanitize(personalized_text)
             
@@ -504,7 +504,7 @@ class RecommendationGenerator:
                 )
                 
                 # Validate tone
-                is_valid, tone_issues = self.tone_validator.check_rationale(rationale)
+                is_valid, _ = self.tone_validator.check_rationale(rationale, detail=False)
                 if not is_valid:
                     # Sanitize if tone issues found
                     rationale = self.tone_validator.sanitize(rationale)
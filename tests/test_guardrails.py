@@ -68,6 +68,18 @@ def test_consent_manager_grant_consent(db_session, sample_user):
     assert consent_obj.consented == True
 
 
+def test_consent_manager_has_consent(db_session, sample_user):
+    """Test has_consent reflects grant and revoke."""
+    manager = consent_module.ConsentManager(db_session)
+    assert manager.has_consent(sample_user.id) == False
+    
+    manager.grant_consent(sample_user.id)
+    assert manager.has_consent(sample_user.id) == True
+    
+    manager.revoke_consent(sample_user.id)
+    assert manager.has_consent(sample_user.id) == False
+
+
 def test_consent_manager_require_consent_raises(db_session, sample_user):
     """Test that require_consent raises PermissionError when no consent."""
     manager = consent_module.ConsentManager(db_session)
@@ -102,6 +114,14 @@ def test_tone_validator_check_rationale_shaming():
     assert len(issues) > 0
 
 
+def test_tone_validator_validate_without_detail():
+    """Test the bool-only validation path."""
+    validator = tone_module.ToneValidator()
+    
+    assert validator.validate("You're overspending on unnecessary items.", detail=False) == (False, [])
+    assert validator.validate("We noticed an opportunity to optimize your spending.", detail=False) == (True, [])
+
+
 def test_tone_validator_sanitize():
     """Test tone sanitization."""
     validator = tone_module.ToneValidator()